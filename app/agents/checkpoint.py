@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.agents.session_state import InterviewData
+from app.crud.interviews import (
+    COMPLETED_STATUS,
+    INCOMPLETE_STATUS,
+    IN_PROGRESS_STATUS,
+    save_interview_progress,
+)
+
+logger = logging.getLogger("app")
+
+
+class InterviewCheckpointer:
+    """Write-behind persistence of an agent session onto its Interview row.
+
+    Tools only call ``mark_dirty()`` (or ``flush_soon()`` on a phase change),
+    which never waits. A background task coalesces everything recorded since
+    the last write into one UPDATE every ``interval_seconds``, or as soon as
+    a flush is requested. Writes run one at a time off the turn loop's path;
+    a failed write is retried on the next tick. ``close()`` makes the final
+    write when the session ends, after any periodic write still in flight.
+    """
+
+    def __init__(self, room_name: str, interview_data: InterviewData, session_factory, interval_seconds: float):
+        self.room_name = room_name
+        self.interview_data = interview_data
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._version = 0
+        self._written_version = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._completed_at: Optional[datetime] = None
+        self._overall_feedback: Optional[str] = None
+        self._closed = False
+        self.writes = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def mark_dirty(self) -> None:
+        """Record that the session changed; written with the next checkpoint"""
+        self._version += 1
+
+    def flush_soon(self) -> None:
+        """Record a change and write it without waiting for the interval"""
+        self._version += 1
+        self._wake.set()
+
+    def complete(self, overall_feedback: str) -> None:
+        """Mark the interview completed; written right away in the background"""
+        self._completed_at = datetime.now(timezone.utc)
+        self._overall_feedback = overall_feedback
+        self.flush_soon()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._closed and self._version != self._written_version:
+                await self._write()
+
+    async def _write(self, final: bool = False) -> bool:
+        version = self._version
+        # Snapshot on the loop (cheap); build the export off it in a thread
+        data = self.interview_data.snapshot()
+        if self._completed_at:
+            status = COMPLETED_STATUS
+        else:
+            status = INCOMPLETE_STATUS if final else IN_PROGRESS_STATUS
+        try:
+            interview_data = await asyncio.to_thread(data.export, self._overall_feedback or "")
+            async with self.session_factory() as db:
+                found = await save_interview_progress(
+                    db,
+                    self.room_name,
+                    interview_data=interview_data,
+                    technical_score=data.technical_score,
+                    behavioral_score=data.behavioral_score,
+                    status=status,
+                    started_at=datetime.fromtimestamp(data.started_at, tz=timezone.utc),
+                    completed_at=self._completed_at,
+                    overall_feedback=self._overall_feedback,
+                    final=final,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failures += 1
+            logger.exception(f"Checkpointing interview in room {self.room_name} failed")
+            return False
+        # A periodic write also misses once the interview is finished, so only
+        # the final (unconditional) write tells whether the room has one
+        if final and not found:
+            logger.warning(f"No interview uses room {self.room_name}; session results are not persisted")
+        self._written_version = version
+        self.writes += 1
+        return True
+
+    async def close(self) -> None:
+        """Stop the background task, letting a write in flight finish, then
+        write the final state. A session that ends without complete_interview
+        is recorded as incomplete."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is not None:
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+        await self._write(final=True)
+        logger.info(f"Interview in room {self.room_name} checkpointed {self.writes} times ({self.failures} failed)")
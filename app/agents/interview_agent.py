@@ -1,69 +1,70 @@
 import asyncio
 import logging
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional
 from livekit import agents
 from livekit.agents import Agent, AgentSession, function_tool, RunContext
 from livekit.plugins import deepgram, cartesia, google, silero, elevenlabs
 from app.core.logging_config import setup_logging
+from app.core.request_context import bind_interview_id, bind_request_id
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
-from datetime import datetime
 import json
 
 from app.prompts.interview_prompts import prompt_manager, InterviewPhase
+from app.agents.checkpoint import InterviewCheckpointer
+from app.agents.prewarm import JobStartupTimer, warm_turn_detector
+from app.agents.interview_config import DEFAULT_INTERVIEW_CONFIG, ResolvedInterview, interview_config_cache
+from app.agents.session_state import InterviewData
+from app.db.database import AsyncSessionLocal
 from app.core.config import settings
 
 setup_logging()
 logger = logging.getLogger("app")
 
-class InterviewData:
-    """Interview session data management"""
-    def __init__(self):
-        self.candidate_name = ""
-        self.position = ""
-        self.current_phase = InterviewPhase.INTRODUCTION
-        self.questions_asked = []
-        self.responses = []
-        self.notes = []
-        self.technical_score = 0
-        self.behavioral_score = 0
-        self.question_count = 0
-        self.start_time = datetime.now()
-
 class InterviewAgent(Agent):
     """AI Interview Agent with enhanced capabilities"""
     
-    def __init__(self, interview_config: Dict[str, Any]):
-        self.interview_data = InterviewData()
+    def __init__(self, interview_config: Dict[str, Any], interview_data: Optional[InterviewData] = None,
+                 checkpointer: Optional[InterviewCheckpointer] = None):
+        self.interview_data = interview_data or InterviewData()
+        # Persists interview_data in the background; tools only flag changes
+        self.checkpointer = checkpointer
         self.max_questions_per_phase = 5
         self.interview_config = interview_config
         
-        # Get system prompt
-        system_prompt = prompt_manager.get_system_prompt(
+        # Get system prompt (compiled once per position and company)
+        compiled_prompt = prompt_manager.compile_system_prompt(
             position=interview_config.get("position", "Software Engineer"),
-            candidate_name=interview_config.get("candidate_name", "Candidate"),
             company_name=interview_config.get("company_name")
         )
+        system_prompt = compiled_prompt.render(interview_config.get("candidate_name", "Candidate"))
+        self.interview_data.prompt_version = compiled_prompt.version
+        logger.info("Using system prompt %s (%d chars)", compiled_prompt.version, len(system_prompt))
         
         super().__init__(instructions=system_prompt)
+
+    def _changed(self, flush: bool = False):
+        if self.checkpointer is not None:
+            if flush:
+                self.checkpointer.flush_soon()
+            else:
+                self.checkpointer.mark_dirty()
     
     @function_tool()
     async def record_candidate_info(self, ctx: RunContext, name: str, position: str):
         """Record candidate's basic information"""
-        logger.info(f"Recording candidate info - Name: {name}, Position: {position}")
+        logger.info("Recording candidate info - Name: %s, Position: %s", name, position)
         self.interview_data.candidate_name = name
         self.interview_data.position = position
+        self._changed()
         return f"Thank you, {name}! I've noted you're interviewing for the {position} position. Let's begin!"
     
     @function_tool()
     async def record_question(self, ctx: RunContext, question: str):
         """Record a question that was asked"""
-        logger.info(f"Recording question: {question}")
-        self.interview_data.questions_asked.append({
-            "question": question,
-            "timestamp": datetime.now().isoformat(),
-            "phase": self.interview_data.current_phase.value
-        })
-        self.interview_data.question_count += 1
+        logger.debug("Recording question: %s", question)
+        self.interview_data.record_question(question)
+        self._changed()
         return "Question recorded."
     
     @function_tool()
@@ -72,37 +73,27 @@ class InterviewAgent(Agent):
         if not 1 <= quality_score <= 5:
             return "Score must be between 1 and 5."
         
-        logger.info(f"Recording response with score {quality_score}")
-        self.interview_data.responses.append({
-            "response_summary": response_summary,
-            "quality_score": quality_score,
-            "timestamp": datetime.now().isoformat(),
-            "phase": self.interview_data.current_phase.value
-        })
-        
-        # Update phase-specific scores
-        if self.interview_data.current_phase == InterviewPhase.TECHNICAL:
-            self.interview_data.technical_score += quality_score
-        elif self.interview_data.current_phase == InterviewPhase.BEHAVIORAL:
-            self.interview_data.behavioral_score += quality_score
+        logger.debug("Recording response with score %s", quality_score)
+        # Also updates the running per-phase score aggregates
+        self.interview_data.record_response(response_summary, quality_score)
+        self._changed()
         
         return f"Response recorded with score {quality_score}/5."
     
     @function_tool()
     async def add_interviewer_note(self, ctx: RunContext, note: str):
         """Add interviewer observation note"""
-        logger.info(f"Adding note: {note}")
-        self.interview_data.notes.append({
-            "note": note,
-            "timestamp": datetime.now().isoformat(),
-            "phase": self.interview_data.current_phase.value
-        })
+        logger.debug("Adding note: %s", note)
+        self.interview_data.add_note(note)
+        self._changed()
         return "Note added."
     
     @function_tool()
     async def advance_interview_phase(self, ctx: RunContext):
         """Move to the next interview phase"""
         current = self.interview_data.current_phase
+        # Checkpoint at phase boundaries rather than waiting for the interval
+        self._changed(flush=True)
         
         if current == InterviewPhase.INTRODUCTION:
             self.interview_data.current_phase = InterviewPhase.TECHNICAL
@@ -127,16 +118,7 @@ class InterviewAgent(Agent):
     @function_tool()
     async def get_interview_status(self, ctx: RunContext):
         """Get current interview status"""
-        duration = datetime.now() - self.interview_data.start_time
-        return {
-            "candidate_name": self.interview_data.candidate_name,
-            "position": self.interview_data.position,
-            "current_phase": self.interview_data.current_phase.value,
-            "duration_minutes": int(duration.total_seconds() / 60),
-            "questions_asked": len(self.interview_data.questions_asked),
-            "technical_score": self.interview_data.technical_score,
-            "behavioral_score": self.interview_data.behavioral_score
-        }
+        return self.interview_data.status()
     
     @function_tool()
     async def complete_interview(self, ctx: RunContext, overall_impression: str):
@@ -144,48 +126,37 @@ class InterviewAgent(Agent):
         logger.info("Completing interview")
         self.interview_data.current_phase = InterviewPhase.COMPLETED
         
-        # Calculate averages
-        tech_responses = [r for r in self.interview_data.responses if r.get("phase") == "technical"]
-        behavioral_responses = [r for r in self.interview_data.responses if r.get("phase") == "behavioral"]
+        summary = self.interview_data.export(overall_impression)
+        if self.checkpointer is not None:
+            # Written in the background; the closing line is not held up
+            self.checkpointer.complete(overall_impression)
         
-        avg_technical = sum(r["quality_score"] for r in tech_responses) / len(tech_responses) if tech_responses else 0
-        avg_behavioral = sum(r["quality_score"] for r in behavioral_responses) / len(behavioral_responses) if behavioral_responses else 0
-        
-        summary = {
-            "candidate_name": self.interview_data.candidate_name,
-            "position": self.interview_data.position,
-            "duration_minutes": int((datetime.now() - self.interview_data.start_time).total_seconds() / 60),
-            "questions_asked": len(self.interview_data.questions_asked),
-            "avg_technical_score": round(avg_technical, 2),
-            "avg_behavioral_score": round(avg_behavioral, 2),
-            "overall_impression": overall_impression,
-            "detailed_data": {
-                "questions": self.interview_data.questions_asked,
-                "responses": self.interview_data.responses,
-                "notes": self.interview_data.notes
-            }
-        }
-        
-        logger.info(f"Interview completed: {summary}")
+        logger.info(
+            "Interview completed: %s questions, technical %.2f, behavioral %.2f",
+            summary["questions_asked"], summary["avg_technical_score"], summary["avg_behavioral_score"],
+            extra={"summary": summary},
+        )
         return f"Interview completed! Thank you for your time, {self.interview_data.candidate_name}. We'll be in touch soon with next steps."
 
-def prewarm_process(proc: agents.JobProcess):
-    """Prewarm models for better performance"""
-    logger.info("Prewarming AI models...")
-    proc.userdata["vad"] = silero.VAD.load()
-    logger.info("VAD model loaded")
-
 async def entrypoint(ctx: agents.JobContext):
     """Main entrypoint for the interview agent"""
+    # Correlate this job's log records
+    bind_request_id(ctx.job.id)
     logger.info("Starting AI Interview Agent")
+    timer = JobStartupTimer()
     
-    interview_config = {
-        "candidate_name": "Candidate",
-        "position": "Software Engineer",
-        "company_name": "Your Company"
-    }
+    # Look the interview up while the session's plugins are built; it is only
+    # needed once the agent (and its prompt) is created
+    lookup_started = time.monotonic()
+    lookup = asyncio.create_task(interview_config_cache.resolve(ctx.room.name))
     
-    agent = InterviewAgent(interview_config)
+    vad = ctx.proc.userdata.get("vad")
+    if vad is None:
+        logger.warning("VAD was not prewarmed; loading it for this job")
+        vad = silero.VAD.load()
+    turn_detection = MultilingualModel()
+    # The first end-of-turn prediction in a process is the slow one; take it now
+    turn_warmup = asyncio.create_task(warm_turn_detector(turn_detection, ctx.proc.userdata))
     
     session = AgentSession(
 
@@ -211,13 +182,47 @@ async def entrypoint(ctx: agents.JobContext):
             streaming=True
         ),
         
-        vad=ctx.proc.userdata.get("vad", silero.VAD.load()),
+        vad=vad,
         
-        turn_detection=MultilingualModel(),
+        turn_detection=turn_detection,
+    )
+    timer.attach(session)
+    
+    try:
+        resolved = await asyncio.wait_for(lookup, timeout=settings.AGENT_CONFIG_LOOKUP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(f"Interview lookup for room {ctx.room.name} timed out; using the default interview config")
+        resolved = ResolvedInterview(None, dict(DEFAULT_INTERVIEW_CONFIG))
+    except Exception:
+        logger.exception(f"Interview lookup for room {ctx.room.name} failed; using the default interview config")
+        resolved = ResolvedInterview(None, dict(DEFAULT_INTERVIEW_CONFIG))
+    bind_interview_id(resolved.interview_id)
+    interview_config = resolved.config
+    logger.info(
+        "Resolved interview config for room %s in %.1f ms",
+        ctx.room.name, (time.monotonic() - lookup_started) * 1000,
     )
+    timer.mark("config_resolved")
+    
+    interview_data = InterviewData()
+    interview_data.candidate_name = interview_config["candidate_name"]
+    interview_data.position = interview_config["position"]
+    checkpointer = InterviewCheckpointer(
+        room_name=ctx.room.name,
+        interview_data=interview_data,
+        session_factory=AsyncSessionLocal,
+        interval_seconds=settings.AGENT_CHECKPOINT_INTERVAL_SECONDS,
+    )
+    checkpointer.start()
+    # Final write when the job ends, including when the candidate disconnects
+    ctx.add_shutdown_callback(checkpointer.close)
+
+    agent = InterviewAgent(interview_config, interview_data=interview_data, checkpointer=checkpointer)
     
     await session.start(room=ctx.room, agent=agent)
+    timer.mark("session_started")
 
     welcome_msg = "Hello! Welcome to your interview today. I'm excited to speak with you and learn more about your background. Could you please start by telling me your name and confirming the position you're interviewing for?"
     # Actually send the welcome message to the participant
     await session.say(welcome_msg)
+    await turn_warmup
@@ -0,0 +1,92 @@
+"""
+Interview configuration for an agent job, resolved from the Interview row
+behind the LiveKit room the job was dispatched to.
+
+Lookups go through the API's pooled async engine (a single indexed SELECT on
+the unique ``room_name``) and are cached for a few seconds per worker process,
+so sessions rejoining the same room (reconnects, redispatched jobs, thread
+executors running several jobs) skip the database entirely.
+"""
+
+import logging
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLLRUCache
+from app.crud.interviews import get_interview_config_by_room
+from app.db.database import AsyncSessionLocal
+
+logger = logging.getLogger("app")
+
+# Used for rooms with no interview (e.g. rooms created by hand for testing)
+DEFAULT_INTERVIEW_CONFIG: Dict[str, Any] = {
+    "candidate_name": "Candidate",
+    "position": "Software Engineer",
+    "company_name": "Your Company",
+}
+
+
+class ResolvedInterview(NamedTuple):
+    interview_id: Optional[str]
+    config: Dict[str, Any]
+
+
+def build_interview_config(candidate_name: Optional[str], position: Optional[str],
+                           interview_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Agent config: defaults, overridden by the interview's ``interview_config``,
+    overridden by its candidate name and position"""
+    config = {**DEFAULT_INTERVIEW_CONFIG, **(interview_config or {})}
+    if candidate_name:
+        config["candidate_name"] = candidate_name
+    if position:
+        config["position"] = position
+    return config
+
+
+class InterviewConfigCache:
+    """Bounded LRU of resolved interview configs keyed by room name.
+
+    Entries live for ``ttl_seconds``; rooms without an interview are not
+    cached, so an interview created just after a miss is picked up on the
+    next lookup. Callers get their own copy of the config.
+    """
+
+    def __init__(self, session_factory, ttl_seconds: float, max_entries: int):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self._cache: TTLLRUCache[str, ResolvedInterview] = TTLLRUCache(max_entries, clock=time.monotonic)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled and self.ttl_seconds > 0
+
+    async def resolve(self, room_name: str) -> ResolvedInterview:
+        """Interview id and agent config for ``room_name``; the defaults (and no
+        id) when no interview uses the room"""
+        resolved = self._cache.get(room_name) if self.enabled else None
+        if resolved is None:
+            async with self.session_factory() as db:
+                row = await get_interview_config_by_room(db, room_name)
+            if row is None:
+                logger.warning(f"No interview uses room {room_name}; using the default interview config")
+                return ResolvedInterview(None, dict(DEFAULT_INTERVIEW_CONFIG))
+            resolved = ResolvedInterview(
+                row.id, build_interview_config(row.candidate_name, row.position, row.interview_config)
+            )
+            if self.enabled:
+                self._cache.set(room_name, resolved, time.monotonic() + self.ttl_seconds)
+        return ResolvedInterview(resolved.interview_id, dict(resolved.config))
+
+    def invalidate(self, room_name: str) -> None:
+        self._cache.invalidate(room_name)
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+interview_config_cache = InterviewConfigCache(
+    AsyncSessionLocal,
+    ttl_seconds=settings.AGENT_CONFIG_CACHE_TTL_SECONDS,
+    max_entries=settings.AGENT_CONFIG_CACHE_MAX_ENTRIES,
+)
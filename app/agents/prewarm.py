@@ -0,0 +1,212 @@
+"""
+Loading and warm-up of the local models an interview session needs.
+
+LiveKit runs ``prewarm_process`` once in every job process before handing it
+a job, so this is where models are loaded and each one runs a dummy
+inference: the first real call then skips lazy initialization (ONNX Runtime
+allocates its arenas and picks kernels on the first run). Per model the
+load and warm-up time and the resident memory it added are recorded.
+
+The turn detector is the exception: its model lives in the worker's shared
+inference process, and its client needs a job context, so it is built per
+session and its first inference is warmed at the start of the process's
+first job instead (``warm_turn_detector``).
+
+    python -m app.agents.prewarm
+
+loads everything in the current process and prints the numbers.
+"""
+
+import asyncio
+import logging
+import os
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from livekit import agents, rtc
+from livekit.agents import llm, tokenize
+from livekit.plugins import silero
+
+logger = logging.getLogger("app")
+
+_WARMUP_TEXT = "Hello! Welcome to your interview today. Could you tell me about yourself?"
+# 100 ms of 10 ms silence frames: a few inference windows
+_VAD_WARMUP_SAMPLE_RATE = 16000
+_VAD_WARMUP_FRAMES = 10
+_VAD_WARMUP_TIMEOUT_SECONDS = 5.0
+
+
+class ModelLoad(NamedTuple):
+    name: str
+    load_seconds: float
+    warmup_seconds: float
+    # Resident memory added by the load and warm-up (approximate: the allocator
+    # may reuse pages freed by earlier steps)
+    rss_bytes: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "load_ms": round(self.load_seconds * 1000, 1),
+            "warmup_ms": round(self.warmup_seconds * 1000, 1),
+            "rss_mib": round(self.rss_bytes / 2 ** 20, 1),
+        }
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process; peak RSS where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def load_model(name: str, load: Callable[[], Any], warmup: Callable[[Any], None]) -> Tuple[Any, ModelLoad]:
+    """Run ``load`` then ``warmup`` on its result, measuring both"""
+    rss_before = current_rss_bytes()
+    started = time.perf_counter()
+    model = load()
+    loaded = time.perf_counter()
+    try:
+        warmup(model)
+    except Exception:
+        # A failed warm-up only costs the first session some latency
+        logger.exception(f"Warming up {name} failed")
+    warmed = time.perf_counter()
+    return model, ModelLoad(name, loaded - started, warmed - loaded, current_rss_bytes() - rss_before)
+
+
+async def _run_vad_stream(vad: silero.VAD) -> None:
+    stream = vad.stream()
+    try:
+        samples = _VAD_WARMUP_SAMPLE_RATE // 100
+        for _ in range(_VAD_WARMUP_FRAMES):
+            stream.push_frame(
+                rtc.AudioFrame.create(_VAD_WARMUP_SAMPLE_RATE, num_channels=1, samples_per_channel=samples)
+            )
+        stream.end_input()
+        # The stream ends once every pushed frame has been through the model
+        async for _ in stream:
+            pass
+    finally:
+        await stream.aclose()
+
+
+def _warm_vad(vad: silero.VAD) -> None:
+    # Silence through a stream runs inference on the ONNX session all of the
+    # VAD's streams share. Prewarm runs before the job process starts its
+    # event loop, so the stream gets a short-lived loop of its own
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("cannot warm up the VAD from inside a running event loop")
+    asyncio.run(asyncio.wait_for(_run_vad_stream(vad), timeout=_VAD_WARMUP_TIMEOUT_SECONDS))
+
+
+def _warm_sentence_tokenizer(tokenizer: tokenize.SentenceTokenizer) -> None:
+    tokenizer.tokenize(_WARMUP_TEXT)
+
+
+def prewarm_models(userdata: Dict[str, Any]) -> List[ModelLoad]:
+    """Load and warm the VAD and the TTS sentence tokenizer into ``userdata``"""
+    loads: List[ModelLoad] = []
+
+    vad, stats = load_model("silero_vad", silero.VAD.load, _warm_vad)
+    userdata["vad"] = vad
+    loads.append(stats)
+
+    # Same tokenizer the agent's TTS node uses to split replies into sentences;
+    # the warm-up loads blingfire's native model once for the whole process
+    _, stats = load_model(
+        "sentence_tokenizer",
+        lambda: tokenize.blingfire.SentenceTokenizer(retain_format=True),
+        _warm_sentence_tokenizer,
+    )
+    loads.append(stats)
+
+    userdata["prewarm"] = loads
+    return loads
+
+
+def prewarm_process(proc: agents.JobProcess) -> None:
+    """LiveKit prewarm hook: runs once per job process, before its first job"""
+    logger.info("Prewarming AI models...")
+    for stats in prewarm_models(proc.userdata):
+        logger.info(
+            "Prewarmed %s: load %.1f ms, warm-up %.1f ms, +%.1f MiB",
+            stats.name, stats.load_seconds * 1000, stats.warmup_seconds * 1000, stats.rss_bytes / 2 ** 20,
+            extra={"model": stats.as_dict()},
+        )
+
+
+async def warm_turn_detector(turn_detector, userdata: Dict[str, Any]) -> Optional[float]:
+    """Run one end-of-turn prediction if this process has not yet; returns its duration"""
+    if userdata.get("turn_detector_warm"):
+        return None
+    userdata["turn_detector_warm"] = True
+    chat_ctx = llm.ChatContext.empty()
+    chat_ctx.add_message(role="assistant", content=_WARMUP_TEXT)
+    chat_ctx.add_message(role="user", content="Sure, I have been a software engineer for five years.")
+    started = time.perf_counter()
+    try:
+        await turn_detector.predict_end_of_turn(chat_ctx)
+    except Exception:
+        logger.exception("Warming up the turn detector failed")
+        return None
+    elapsed = time.perf_counter() - started
+    logger.info("Warmed up the turn detector in %.1f ms", elapsed * 1000)
+    return elapsed
+
+
+class JobStartupTimer:
+    """Milestones of one job, in seconds since the entrypoint was called (the
+    job has been assigned to this process by then); logged once the agent's
+    first audio starts playing."""
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, name: str) -> None:
+        self.marks.setdefault(name, time.perf_counter() - self._started)
+
+    def attach(self, session: agents.AgentSession) -> None:
+        """Mark ``first_audio`` when the agent first starts speaking"""
+
+        def on_state_changed(event) -> None:
+            if event.new_state == "speaking" and "first_audio" not in self.marks:
+                self.mark("first_audio")
+                session.off("agent_state_changed", on_state_changed)
+                self.log()
+
+        session.on("agent_state_changed", on_state_changed)
+
+    def log(self) -> None:
+        timings = {name: round(seconds * 1000, 1) for name, seconds in self.marks.items()}
+        logger.info(
+            "Job startup: " + ", ".join(f"{name} {ms} ms" for name, ms in timings.items()),
+            extra={"startup_ms": timings},
+        )
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.WARNING)
+    rss_before = current_rss_bytes()
+    loads = prewarm_models({})
+    print(f"{'model':<20} {'load ms':>9} {'warm-up ms':>11} {'+RSS MiB':>9}")
+    for stats in loads:
+        row = stats.as_dict()
+        print(f"{row['name']:<20} {row['load_ms']:>9} {row['warmup_ms']:>11} {row['rss_mib']:>9}")
+    print(f"process RSS: +{(current_rss_bytes() - rss_before) / 2 ** 20:.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from livekit.agents import cli
-from app.agents.interview_agent import entrypoint, prewarm_process
+from app.agents.interview_agent import entrypoint
+from app.agents.prewarm import prewarm_process
 
 if __name__ == "__main__":
     cli.run_app(entrypoint, prewarm_process=prewarm_process)
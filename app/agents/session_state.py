@@ -0,0 +1,247 @@
+"""Per-session interview state held by the agent.
+
+One InterviewData lives for each call, so it is kept compact: slotted
+objects, records as tuples, timestamps as float offsets from a monotonic
+clock (converted to ISO strings only when exported), and running score
+aggregates per phase so status and averages never rescan the history.
+
+    python -m app.agents.session_state [--questions 40] [--notes 10] [--text-chars 200]
+
+prints the memory one session takes, for sizing agent workers.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from app.prompts.interview_prompts import InterviewPhase
+
+
+class QuestionRecord(NamedTuple):
+    at: float
+    phase: InterviewPhase
+    question: str
+
+
+class ResponseRecord(NamedTuple):
+    at: float
+    phase: InterviewPhase
+    quality_score: int
+    response_summary: str
+
+
+class NoteRecord(NamedTuple):
+    at: float
+    phase: InterviewPhase
+    note: str
+
+
+class PhaseStats:
+    """Running count, sum, min and max of response scores in one phase"""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def add(self, score: int) -> None:
+        self.count += 1
+        self.total += score
+        if self.min is None or score < self.min:
+            self.min = score
+        if self.max is None or score > self.max:
+            self.max = score
+
+    def copy(self) -> "PhaseStats":
+        stats = PhaseStats()
+        stats.count, stats.total, stats.min, stats.max = self.count, self.total, self.min, self.max
+        return stats
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "average": round(self.average, 2),
+        }
+
+
+class InterviewData:
+    """Interview session data management"""
+
+    __slots__ = (
+        "candidate_name",
+        "position",
+        "current_phase",
+        "question_count",
+        "questions",
+        "responses",
+        "notes",
+        "phase_stats",
+        "prompt_version",
+        "started_at",
+        "_started_monotonic",
+    )
+
+    def __init__(self):
+        self.candidate_name = ""
+        self.position = ""
+        self.current_phase = InterviewPhase.INTRODUCTION
+        # Questions asked in the current phase
+        self.question_count = 0
+        self.questions: List[QuestionRecord] = []
+        self.responses: List[ResponseRecord] = []
+        self.notes: List[NoteRecord] = []
+        self.phase_stats: Dict[InterviewPhase, PhaseStats] = {phase: PhaseStats() for phase in InterviewPhase}
+        # Version of the system prompt the session ran with, kept with its results
+        self.prompt_version: Optional[str] = None
+        # Wall-clock anchor for export; elapsed times come from the monotonic clock
+        self.started_at = time.time()
+        self._started_monotonic = time.monotonic()
+
+    def snapshot(self) -> "InterviewData":
+        """Copy that later changes do not affect, cheap to take: records are
+        immutable tuples, so only the lists and phase stats are copied"""
+        data = InterviewData.__new__(InterviewData)
+        for name in self.__slots__:
+            setattr(data, name, getattr(self, name))
+        data.questions = list(self.questions)
+        data.responses = list(self.responses)
+        data.notes = list(self.notes)
+        data.phase_stats = {phase: stats.copy() for phase, stats in self.phase_stats.items()}
+        return data
+
+    def elapsed(self) -> float:
+        """Seconds since the session started"""
+        return time.monotonic() - self._started_monotonic
+
+    def record_question(self, question: str) -> None:
+        self.questions.append(QuestionRecord(self.elapsed(), self.current_phase, question))
+        self.question_count += 1
+
+    def record_response(self, response_summary: str, quality_score: int) -> None:
+        self.responses.append(ResponseRecord(self.elapsed(), self.current_phase, quality_score, response_summary))
+        self.phase_stats[self.current_phase].add(quality_score)
+
+    def add_note(self, note: str) -> None:
+        self.notes.append(NoteRecord(self.elapsed(), self.current_phase, note))
+
+    @property
+    def technical_score(self) -> int:
+        return self.phase_stats[InterviewPhase.TECHNICAL].total
+
+    @property
+    def behavioral_score(self) -> int:
+        return self.phase_stats[InterviewPhase.BEHAVIORAL].total
+
+    def status(self) -> Dict[str, Any]:
+        """Current status; constant time regardless of session length"""
+        return {
+            "candidate_name": self.candidate_name,
+            "position": self.position,
+            "current_phase": self.current_phase.value,
+            "duration_minutes": int(self.elapsed() / 60),
+            "questions_asked": len(self.questions),
+            "technical_score": self.technical_score,
+            "behavioral_score": self.behavioral_score,
+        }
+
+    def _timestamp(self, at: float) -> str:
+        return datetime.fromtimestamp(self.started_at + at, tz=timezone.utc).isoformat()
+
+    def export(self, overall_impression: str) -> Dict[str, Any]:
+        """Final summary with the full history, timestamps as ISO strings"""
+        return {
+            "candidate_name": self.candidate_name,
+            "position": self.position,
+            "duration_minutes": int(self.elapsed() / 60),
+            "questions_asked": len(self.questions),
+            "avg_technical_score": round(self.phase_stats[InterviewPhase.TECHNICAL].average, 2),
+            "avg_behavioral_score": round(self.phase_stats[InterviewPhase.BEHAVIORAL].average, 2),
+            "overall_impression": overall_impression,
+            "prompt_version": self.prompt_version,
+            "phase_stats": {
+                phase.value: stats.as_dict() for phase, stats in self.phase_stats.items() if stats.count
+            },
+            "detailed_data": {
+                "questions": [
+                    {"question": q.question, "timestamp": self._timestamp(q.at), "phase": q.phase.value}
+                    for q in self.questions
+                ],
+                "responses": [
+                    {
+                        "response_summary": r.response_summary,
+                        "quality_score": r.quality_score,
+                        "timestamp": self._timestamp(r.at),
+                        "phase": r.phase.value,
+                    }
+                    for r in self.responses
+                ],
+                "notes": [
+                    {"note": n.note, "timestamp": self._timestamp(n.at), "phase": n.phase.value}
+                    for n in self.notes
+                ],
+            },
+        }
+
+
+def _simulate_session(questions: int, notes: int, text_chars: int) -> InterviewData:
+    data = InterviewData()
+    data.candidate_name = "Candidate"
+    data.position = "Software Engineer"
+    phases = [InterviewPhase.TECHNICAL, InterviewPhase.BEHAVIORAL]
+    for i in range(questions):
+        data.current_phase = phases[i * len(phases) // max(1, questions)]
+        # Distinct strings, as the LLM's would be
+        data.record_question(f"{i:06d}".ljust(text_chars, "q"))
+        data.record_response(f"{i:06d}".ljust(text_chars, "r"), 1 + i % 5)
+    for i in range(notes):
+        data.add_note(f"{i:06d}".ljust(text_chars, "n"))
+    return data
+
+
+def measure_session_bytes(questions: int, notes: int, text_chars: int, sessions: int = 100) -> float:
+    """Average bytes allocated per session (state plus the texts it holds)"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        held = [_simulate_session(questions, notes, text_chars) for _ in range(sessions)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del held
+    return allocated / sessions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Memory per interview session")
+    parser.add_argument("--questions", type=int, default=40, help="questions (each with a scored response)")
+    parser.add_argument("--notes", type=int, default=10)
+    parser.add_argument("--text-chars", type=int, default=200, help="length of each question, response and note")
+    parser.add_argument("--sessions", type=int, default=100, help="sessions to average over")
+    args = parser.parse_args(argv)
+
+    per_session = measure_session_bytes(args.questions, args.notes, args.text_chars, args.sessions)
+    text_bytes = (2 * args.questions + args.notes) * sys.getsizeof("x" * args.text_chars)
+    print(
+        f"{per_session / 1024:.1f} KiB per session "
+        f"({args.questions} questions and responses, {args.notes} notes, {args.text_chars}-char texts; "
+        f"~{text_bytes / 1024:.1f} KiB of that is the texts)"
+    )
+    print(f"{1024 ** 3 / per_session:,.0f} sessions per GiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
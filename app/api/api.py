@@ -1,12 +1,20 @@
-from fastapi import APIRouter
-from app.api.v1.routes import auth, users, interviews, api_keys
+from fastapi import APIRouter, Depends
+from app.api.v1.routes import auth, users, interviews, api_keys, profiles
+from app.core.request_context import bind_interview_from_path
 
 v1_router = APIRouter(prefix="/v1")
 
 v1_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 v1_router.include_router(users.router, prefix="/users", tags=["Users"])
-v1_router.include_router(interviews.router, prefix="/interviews", tags=["Interviews"])
+v1_router.include_router(
+    interviews.router,
+    prefix="/interviews",
+    tags=["Interviews"],
+    # Tags log records of /interviews/{interview_id}/... with the interview id
+    dependencies=[Depends(bind_interview_from_path)],
+)
 v1_router.include_router(api_keys.router, prefix="/api-keys", tags=["API Keys"])
+v1_router.include_router(profiles.router, prefix="/profiles", tags=["Profiling"])
 
 api_router = APIRouter()
 api_router.include_router(v1_router)
@@ -2,20 +2,26 @@ from datetime import datetime, timezone
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import models
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal, get_db
 from app.core.security import decode_access_token
+from app.core.auth_cache import auth_cache
 from app.crud.tokens import is_token_blocklisted
 from app.crud.users import get_user_by_email
-from app.crud.api_keys import get_api_key, update_api_key_usage
+from app.crud.api_keys import get_api_key, record_api_key_usage
 from typing import Optional
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 http_bearer = HTTPBearer()
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> models.User:
-    """Get current authenticated user, checking for token revocation."""
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> models.User:
+    """Get current authenticated user, checking for token revocation.
+
+    Revocation is checked against the in-memory index first, then resolved
+    users are served from the per-jti cache, so repeat calls with the same
+    token need no database round trips until the cache entry expires.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -35,14 +41,20 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         
         if datetime.now(timezone.utc) > expire_time:
              raise credentials_exception
-             
-        if is_token_blocklisted(db, jti=jti):
+
+        if await is_token_blocklisted(db, jti=jti):
+            auth_cache.invalidate_token(jti)
             raise credentials_exception
 
-        user = get_user_by_email(db, email=email)
+        cached_user = auth_cache.get(jti)
+        if cached_user is not None:
+            return await db.merge(cached_user, load=False)
+
+        user = await get_user_by_email(db, email=email)
         if user is None:
             raise credentials_exception
         
+        auth_cache.set(jti, user, token_exp=int(exp))
         return user
 
     except JWTError:
@@ -53,20 +65,37 @@ async def get_current_active_user(current_user: models.User = Depends(get_curren
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+async def get_current_superuser(current_user: models.User = Depends(get_current_active_user)):
+    """Get current active user, requiring superuser rights"""
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Superuser required")
+    return current_user
+
+async def is_superuser_token(token: str) -> bool:
+    """Whether a bearer token belongs to an active superuser, for checks made
+    outside FastAPI dependencies (e.g. in middleware)"""
+    async with AsyncSessionLocal() as db:
+        try:
+            user = await get_current_user(token, db)
+        except HTTPException:
+            return False
+        return bool(user.is_active and user.is_superuser)
+
 async def get_api_key_user(
     credentials: HTTPAuthorizationCredentials = Depends(http_bearer),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Authenticate using API key"""
     api_key = credentials.credentials
     
-    db_api_key = get_api_key(db, key=api_key)
+    db_api_key = await get_api_key(db, key=api_key)
     if not db_api_key or not db_api_key.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or inactive API key"
         )
     
-    update_api_key_usage(db, db_api_key.id)
+    await record_api_key_usage(db, db_api_key.id)
     
     return db_api_key.owner
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.crud.api_keys import (
-    create_api_key,
+    create_api_key as create_api_key_crud,
     get_user_api_keys,
     deactivate_api_key as deactivate_api_key_crud,
 )
@@ -18,10 +18,10 @@ router = APIRouter()
 async def create_api_key(
     api_key: api_key_schemas.APIKeyCreate,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create new API key"""
-    existing_keys = get_user_api_keys(db, user_id=current_user.id)
+    existing_keys = await get_user_api_keys(db, user_id=current_user.id)
     active_keys = [k for k in existing_keys if k.is_active]
     
     if len(active_keys) >= settings.MAX_API_KEYS_PER_USER:
@@ -30,24 +30,24 @@ async def create_api_key(
             detail=f"Maximum number of API keys ({settings.MAX_API_KEYS_PER_USER}) reached"
         )
     
-    return create_api_key(db=db, api_key=api_key, user_id=current_user.id)
+    return await create_api_key_crud(db=db, api_key=api_key, user_id=current_user.id)
 
 @router.get("/", response_model=List[api_key_schemas.APIKey])
 async def list_api_keys(
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """List user's API keys"""
-    return get_user_api_keys(db, user_id=current_user.id)
+    return await get_user_api_keys(db, user_id=current_user.id)
 
 @router.delete("/{key_id}")
 async def deactivate_api_key(
     key_id: str,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Deactivate API key"""
-    success = deactivate_api_key_crud(db, key_id=key_id, user_id=current_user.id)
+    success = await deactivate_api_key_crud(db, key_id=key_id, user_id=current_user.id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
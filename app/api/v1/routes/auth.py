@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Header, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 
 from app.crud.users import (
@@ -15,15 +15,16 @@ from app.schemas import auth as auth_schemas
 from app.db.database import get_db
 from app.core.config import settings
 from app.core.security import create_access_token, decode_access_token
+from app.core.auth_cache import auth_cache
 from app.api.deps import get_current_active_user
 
 router = APIRouter()
 
 @router.post("/register", response_model=user_schemas.User)
-async def register(user: user_schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user: user_schemas.UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a new user"""
     # Check if user already exists
-    db_user = get_user_by_email(db, email=user.email)
+    db_user = await get_user_by_email(db, email=user.email)
     if db_user:
         raise HTTPException(
             status_code=400,
@@ -31,7 +32,7 @@ async def register(user: user_schemas.UserCreate, db: Session = Depends(get_db))
             detail="Email already registered"
         )
     
-    db_user = get_user_by_username(db, username=user.username)
+    db_user = await get_user_by_username(db, username=user.username)
     if db_user:
         raise HTTPException(
             status_code=400,
@@ -39,12 +40,12 @@ async def register(user: user_schemas.UserCreate, db: Session = Depends(get_db))
         )
     
     # Create user
-    return create_user(db=db, user=user)
+    return await create_user(db=db, user=user)
 
 @router.post("/login", response_model=auth_schemas.Token)
-async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     """Login user and return access token"""
-    user = authenticate_user(db, email=form_data.username, password=form_data.password)
+    user = await authenticate_user(db, email=form_data.username, password=form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,7 +63,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
 @router.post("/logout")
 async def logout(
     authorization: str = Header(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Logout user by adding the current token to the blocklist.
@@ -87,7 +88,8 @@ async def logout(
         expires_at = datetime.fromtimestamp(int(exp), tz=timezone.utc)
         
         # Add token to blocklist
-        add_token_to_blocklist(db, jti=jti, expires_at=expires_at)
+        await add_token_to_blocklist(db, jti=jti, expires_at=expires_at)
+        auth_cache.invalidate_token(jti)
         
     except HTTPException:
         raise
@@ -1,68 +1,361 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import asyncio
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional, Union
 
 from app.crud.interviews import (
     create_interview as create_interview_crud,
+    create_interviews as create_interviews_crud,
+    PROVISIONING_STATUS,
+    get_interview_status as get_interview_status_crud,
+    set_interviews_status as set_interviews_status_crud,
+    stream_interviews_for_export,
+    EXPORT_COLUMNS,
     get_user_interviews as get_user_interviews_crud,
+    get_user_interview_versions as get_user_interview_versions_crud,
     get_interview as get_interview_crud,
+    load_interview_payload as load_interview_payload_crud,
     update_interview as update_interview_crud,
+    update_interview_if_unmodified as update_interview_if_unmodified_crud,
 )
 from app.schemas import interview as interview_schemas
-from app.db.database import get_db
+from app.db.database import AsyncSessionLocal, get_db
 from app.api.deps import get_current_active_user, get_api_key_user
 from app.core.livekit_manager import LiveKitManager
+from app.core.room_pool import ROOM_EMPTY_TIMEOUT_SECONDS, RoomPool
+from app.core.room_provisioner import RoomProvisioner
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.request_context import bind_interview_id
+from app.core.etag import CACHE_CONTROL, collection_etag, etag_in, interview_etag
+from app.core.interview_export import EXPORT_MEDIA_TYPES, csv_chunks, ndjson_chunks
 
 router = APIRouter()
 
+# fields= query parameter: "summary" loads only the InterviewSummary columns,
+# "full" also loads the JSON payload (interview_config, interview_data)
+InterviewFields = Literal["summary", "full"]
+
+def _interview_schema(fields: str):
+    return interview_schemas.Interview if fields == "full" else interview_schemas.InterviewSummary
+
+def _split_page(rows, limit: int):
+    """Drop the look-ahead row of a keyset page; returns (rows, next_cursor)"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+def _validator_headers(etag: str, next_cursor: Optional[str] = None) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return headers
+
 def get_livekit_manager(request: Request) -> LiveKitManager:
     """Reuse app-scoped LiveKitManager singleton when available."""
     if hasattr(request.app.state, "livekit_manager") and request.app.state.livekit_manager:
         return request.app.state.livekit_manager
     return LiveKitManager()
 
-@router.post("/", response_model=interview_schemas.Interview)
-async def create_interview(
+def get_room_pool(request: Request) -> Optional[RoomPool]:
+    """App-scoped pool of pre-created rooms, if one is running."""
+    return getattr(request.app.state, "room_pool", None)
+
+def get_room_provisioner(request: Request) -> Optional[RoomProvisioner]:
+    """App-scoped background room provisioner, if one is running."""
+    return getattr(request.app.state, "room_provisioner", None)
+
+def get_async_room_provisioner(request: Request, prefer: Optional[str] = Header(None)) -> Optional[RoomProvisioner]:
+    """App-scoped background room provisioner, when the client sent ``Prefer: respond-async``"""
+    if not prefer or not any(p.split(";")[0].strip().lower() == "respond-async" for p in prefer.split(",")):
+        return None
+    return get_room_provisioner(request)
+
+async def _create_interview_with_room(
+    db: AsyncSession,
     interview: interview_schemas.InterviewCreate,
-    current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
-    livekit_manager: LiveKitManager = Depends(get_livekit_manager)
+    user_id: str,
+    livekit_manager: LiveKitManager,
+    room_pool: Optional[RoomPool],
+    room_provisioner: Optional[RoomProvisioner] = None,
 ):
-    """Create new interview session"""
-    db_interview = create_interview_crud(db=db, interview=interview, user_id=current_user.id)
-    
+    """Create the interview in a pre-provisioned room, or create its room when the pool is empty.
+
+    With ``room_provisioner`` the room is created in the background and the
+    interview is returned in "provisioning" status.
+    """
+    room_name = room_pool.claim() if room_pool else None
+    if room_name:
+        db_interview = await create_interview_crud(db=db, interview=interview, user_id=user_id, room_name=room_name)
+        bind_interview_id(db_interview.id)
+        return db_interview
+
+    if room_provisioner is not None:
+        db_interview = await create_interview_crud(db=db, interview=interview, user_id=user_id, status=PROVISIONING_STATUS)
+        bind_interview_id(db_interview.id)
+        if not room_provisioner.submit(db_interview.id, db_interview.room_name):
+            # Queue full: provision inline rather than turn the request away
+            await room_provisioner.provision(db_interview.id, db_interview.room_name)
+            await db.refresh(db_interview, attribute_names=["status", "updated_at"])
+        return db_interview
+
+    db_interview = await create_interview_crud(db=db, interview=interview, user_id=user_id)
+    bind_interview_id(db_interview.id)
     room_created = await livekit_manager.create_room(
         room_name=db_interview.room_name,
-        empty_timeout=1800  # 30 minutes
+        empty_timeout=ROOM_EMPTY_TIMEOUT_SECONDS
     )
     
     if not room_created:
-        update_interview_crud(
-            db, 
-            db_interview.id, 
-            interview_schemas.InterviewUpdate(status="room_creation_failed")
-        )
+        await set_interviews_status_crud(db, [db_interview.id], "room_creation_failed")
     
     return db_interview
 
-@router.get("/", response_model=List[interview_schemas.Interview])
+def _accepted(response: Response, request: Request, db_interview, status_route: str) -> None:
+    """Answer 202 pointing at the status endpoint while the room is provisioned"""
+    if db_interview.status != PROVISIONING_STATUS:
+        return
+    response.status_code = status.HTTP_202_ACCEPTED
+    response.headers["Location"] = str(request.url_for(status_route, interview_id=db_interview.id))
+    response.headers["Preference-Applied"] = "respond-async"
+
+# Server-sent status events: how often a subscriber re-reads the status (a room
+# provisioned by this worker wakes it earlier) and how long a stream stays open
+STATUS_EVENTS_POLL_SECONDS = 1.0
+STATUS_EVENTS_TIMEOUT_SECONDS = 120
+
+def _status_events(interview_id: str, room_provisioner: Optional[RoomProvisioner]) -> StreamingResponse:
+    """Stream the interview's status as server-sent events until it leaves "provisioning" """
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STATUS_EVENTS_TIMEOUT_SECONDS
+        last_status = None
+        while True:
+            # Short sessions: no connection is held while waiting
+            async with AsyncSessionLocal() as db:
+                row = await get_interview_status_crud(db, interview_id)
+            current = row.status if row else None
+            if current != last_status:
+                payload = interview_schemas.InterviewStatus(id=interview_id, status=current or "deleted")
+                yield f"event: status\ndata: {payload.model_dump_json()}\n\n"
+                last_status = current
+            if current != PROVISIONING_STATUS or loop.time() >= deadline:
+                return
+            if room_provisioner is not None:
+                await room_provisioner.wait(interview_id, timeout=STATUS_EVENTS_POLL_SECONDS)
+            else:
+                await asyncio.sleep(STATUS_EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+async def _bulk_create_interviews(
+    db: AsyncSession,
+    payload: interview_schemas.InterviewBulkCreate,
+    user_id: str,
+    livekit_manager: LiveKitManager,
+    room_pool: Optional[RoomPool],
+) -> interview_schemas.InterviewBulkResult:
+    """Insert every interview in one transaction, then provision rooms concurrently"""
+    items = payload.interviews
+    if not items or len(items) > settings.BULK_INTERVIEW_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {settings.BULK_INTERVIEW_MAX_ITEMS} interviews"
+        )
+
+    room_names = [room_pool.claim() if room_pool else None for _ in items]
+    db_interviews = await create_interviews_crud(db, items, user_id=user_id, room_names=room_names)
+
+    semaphore = asyncio.Semaphore(settings.BULK_ROOM_PROVISION_CONCURRENCY)
+
+    async def provision(db_interview) -> bool:
+        async with semaphore:
+            return await livekit_manager.create_room(
+                room_name=db_interview.room_name,
+                empty_timeout=ROOM_EMPTY_TIMEOUT_SECONDS
+            )
+
+    pending = [db_interview for db_interview, room_name in zip(db_interviews, room_names) if not room_name]
+    provisioned = await asyncio.gather(*(provision(db_interview) for db_interview in pending))
+    failed_ids = [db_interview.id for db_interview, ok in zip(pending, provisioned) if not ok]
+    await set_interviews_status_crud(db, failed_ids, "room_creation_failed")
+
+    failed = set(failed_ids)
+    return interview_schemas.InterviewBulkResult(
+        created=len(db_interviews) - len(failed),
+        room_creation_failed=len(failed),
+        items=[
+            interview_schemas.InterviewBulkItem(
+                index=index,
+                status="room_creation_failed" if db_interview.id in failed else "created",
+                interview=db_interview,
+            )
+            for index, db_interview in enumerate(db_interviews)
+        ],
+    )
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps are stored in UTC; naive query values are taken as UTC"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc)
+
+def _export_interviews(
+    user,
+    export_format: str,
+    status_filter: Optional[str],
+    created_from: Optional[datetime],
+    created_to: Optional[datetime],
+) -> StreamingResponse:
+    """Stream the user's interviews (every user's, for superusers) as NDJSON or CSV"""
+    creator_id = None if user.is_superuser else user.id
+
+    async def body():
+        # The export outlives the request-scoped session, so it reads through its own
+        async with AsyncSessionLocal() as db:
+            batches = stream_interviews_for_export(
+                db,
+                creator_id=creator_id,
+                status=status_filter,
+                created_from=_as_utc(created_from),
+                created_to=_as_utc(created_to),
+                batch_size=settings.INTERVIEW_EXPORT_BATCH_SIZE,
+            )
+            serialize = csv_chunks if export_format == "csv" else ndjson_chunks
+            async for chunk in serialize(EXPORT_COLUMNS, batches):
+                yield chunk
+
+    filename = f"interviews-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.{export_format}"
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+# Documents the async response of the create endpoints
+ACCEPTED_RESPONSE = {
+    status.HTTP_202_ACCEPTED: {
+        "model": interview_schemas.InterviewSummary,
+        "description": "Sent Prefer: respond-async; the room is being created (poll Location)",
+    }
+}
+
+@router.post("/", response_model=interview_schemas.InterviewSummary, responses=ACCEPTED_RESPONSE)
+async def create_interview(
+    interview: interview_schemas.InterviewCreate,
+    request: Request,
+    response: Response,
+    current_user = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    livekit_manager: LiveKitManager = Depends(get_livekit_manager),
+    room_pool: Optional[RoomPool] = Depends(get_room_pool),
+    room_provisioner: Optional[RoomProvisioner] = Depends(get_async_room_provisioner)
+):
+    """Create new interview session.
+
+    With ``Prefer: respond-async`` the response is 202 as soon as the
+    interview is stored, and its room is created in the background.
+    """
+    db_interview = await _create_interview_with_room(
+        db, interview, current_user.id, livekit_manager, room_pool, room_provisioner
+    )
+    _accepted(response, request, db_interview, "get_interview_status")
+    return db_interview
+
+@router.post("/bulk", response_model=interview_schemas.InterviewBulkResult)
+async def bulk_create_interviews(
+    payload: interview_schemas.InterviewBulkCreate,
+    current_user = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    livekit_manager: LiveKitManager = Depends(get_livekit_manager),
+    room_pool: Optional[RoomPool] = Depends(get_room_pool)
+):
+    """Create a batch of interviews in one request"""
+    return await _bulk_create_interviews(db, payload, current_user.id, livekit_manager, room_pool)
+
+@router.get("/", response_model=Union[List[interview_schemas.InterviewSummary], List[interview_schemas.Interview]])
 async def list_interviews(
+    response: Response,
+    cursor: Optional[str] = None,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1),
+    fields: InterviewFields = "summary",
+    if_none_match: Optional[str] = Header(None),
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """List user's interviews"""
-    return get_user_interviews_crud(db, user_id=current_user.id, skip=skip, limit=limit)
+    """List user's interviews, newest first.
+
+    Pass the X-Next-Cursor header of one page as ``cursor`` to fetch the next;
+    ``skip`` keeps the legacy offset pagination. ``fields=full`` adds the
+    results and JSON payload to each item. A page whose ETag matches
+    If-None-Match is answered with 304 after checking only row versions.
+    """
+    if skip and cursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and skip cannot be combined"
+        )
+
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
 
-@router.get("/{interview_id}", response_model=interview_schemas.Interview)
+    # Keyset pages fetch one extra row to tell whether a next page exists
+    page = dict(user_id=current_user.id, skip=skip, limit=limit if skip else limit + 1, after=after)
+    if if_none_match:
+        versions, next_cursor = _split_page(await get_user_interview_versions_crud(db, **page), limit)
+        etag = collection_etag(versions, has_more=next_cursor is not None, fields=fields)
+        if etag_in(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_validator_headers(etag, next_cursor))
+
+    interviews, next_cursor = _split_page(await get_user_interviews_crud(db, full=fields == "full", **page), limit)
+    response.headers.update(
+        _validator_headers(collection_etag(interviews, has_more=next_cursor is not None, fields=fields), next_cursor)
+    )
+    schema = _interview_schema(fields)
+    return [schema.model_validate(interview) for interview in interviews]
+
+@router.get("/export")
+async def export_interviews(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status_filter: Optional[str] = Query(None, alias="status"),
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user = Depends(get_current_active_user)
+):
+    """Stream interviews with results as NDJSON or CSV"""
+    return _export_interviews(current_user, format, status_filter, created_from, created_to)
+
+@router.get("/{interview_id}", response_model=Union[interview_schemas.InterviewSummary, interview_schemas.Interview])
 async def get_interview(
     interview_id: str,
+    response: Response,
+    fields: InterviewFields = "summary",
+    if_none_match: Optional[str] = Header(None),
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get interview details"""
-    db_interview = get_interview_crud(db, interview_id=interview_id)
+    """Get interview details; ``fields=full`` adds the results and JSON payload.
+
+    Answers 304 when If-None-Match matches, before the payload is loaded.
+    """
+    db_interview = await get_interview_crud(db, interview_id=interview_id)
     
     if not db_interview:
         raise HTTPException(
@@ -76,17 +369,31 @@ async def get_interview(
             detail="Not enough permissions"
         )
     
-    return db_interview
+    etag = interview_etag(db_interview, fields)
+    if etag_in(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_validator_headers(etag))
 
-@router.put("/{interview_id}", response_model=interview_schemas.Interview)
+    if fields == "full":
+        await load_interview_payload_crud(db, db_interview)
+    response.headers.update(_validator_headers(interview_etag(db_interview, fields)))
+    return _interview_schema(fields).model_validate(db_interview)
+
+@router.put("/{interview_id}", response_model=interview_schemas.InterviewSummary)
 async def update_interview(
     interview_id: str,
     interview_update: interview_schemas.InterviewUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    livekit_manager: LiveKitManager = Depends(get_livekit_manager)
 ):
-    """Update interview"""
-    db_interview = crud.get_interview(db, interview_id=interview_id)
+    """Update interview.
+
+    With If-Match the update only applies if the interview still has that
+    ETag; otherwise 412 is returned and the client should reload and retry.
+    """
+    db_interview = await get_interview_crud(db, interview_id=interview_id)
     
     if not db_interview:
         raise HTTPException(
@@ -100,18 +407,70 @@ async def update_interview(
             detail="Not enough permissions"
         )
     
-    updated_interview = update_interview_crud(db, interview_id, interview_update)
+    previous_status = db_interview.status
+    if if_match is None:
+        updated_interview = await update_interview_crud(db, interview_id, interview_update)
+    elif any(etag_in(if_match, interview_etag(db_interview, fields), strong=True) for fields in ("summary", "full")):
+        # Either representation's ETag identifies the version being replaced
+        updated_interview = await update_interview_if_unmodified_crud(db, db_interview, interview_update)
+    else:
+        updated_interview = None
+    if updated_interview is None:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Interview was modified; reload it and retry"
+        )
+
+    if updated_interview.status != previous_status:
+        livekit_manager.token_cache.invalidate_room(updated_interview.room_name)
+    response.headers.update(_validator_headers(interview_etag(updated_interview)))
     return updated_interview
 
+async def _interview_status(db: AsyncSession, interview_id: str, user, allow_superuser: bool):
+    """(creator_id, status) of an interview the user may see; 404/403 otherwise"""
+    row = await get_interview_status_crud(db, interview_id)
+    if row is None or (not allow_superuser and row.creator_id != user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Interview not found"
+        )
+    if row.creator_id != user.id and not user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return row
+
+@router.get("/{interview_id}/status", response_model=interview_schemas.InterviewStatus)
+async def get_interview_status(
+    interview_id: str,
+    current_user = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Current status only, e.g. to poll while the room is "provisioning" """
+    row = await _interview_status(db, interview_id, current_user, allow_superuser=True)
+    return interview_schemas.InterviewStatus(id=interview_id, status=row.status)
+
+@router.get("/{interview_id}/status/events")
+async def interview_status_events(
+    interview_id: str,
+    current_user = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db),
+    room_provisioner: Optional[RoomProvisioner] = Depends(get_room_provisioner)
+):
+    """Server-sent status events until the interview leaves "provisioning" """
+    await _interview_status(db, interview_id, current_user, allow_superuser=True)
+    return _status_events(interview_id, room_provisioner)
+
 @router.post("/{interview_id}/token", response_model=interview_schemas.InterviewToken)
 async def generate_interview_token(
     interview_id: str,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     livekit_manager: LiveKitManager = Depends(get_livekit_manager)
 ):
     """Generate LiveKit token for interview participant"""
-    db_interview = get_interview_crud(db, interview_id=interview_id)
+    db_interview = await get_interview_crud(db, interview_id=interview_id)
     
     if not db_interview:
         raise HTTPException(
@@ -128,7 +487,8 @@ async def generate_interview_token(
     token = livekit_manager.generate_token(
         room_name=db_interview.room_name,
         participant_name=db_interview.candidate_name,
-        identity=f"candidate-{db_interview.id}"
+        identity=f"candidate-{db_interview.id}",
+        revision=db_interview.status
     )
     
     return interview_schemas.InterviewToken(
@@ -137,39 +497,76 @@ async def generate_interview_token(
         participant_name=db_interview.candidate_name
     )
 
-@router.post("/api/create", response_model=interview_schemas.Interview)
+@router.post("/api/create", response_model=interview_schemas.InterviewSummary, responses=ACCEPTED_RESPONSE)
 async def api_create_interview(
     interview: interview_schemas.InterviewCreate,
+    request: Request,
+    response: Response,
     current_user = Depends(get_api_key_user),
-    db: Session = Depends(get_db),
-    livekit_manager: LiveKitManager = Depends(get_livekit_manager)
+    db: AsyncSession = Depends(get_db),
+    livekit_manager: LiveKitManager = Depends(get_livekit_manager),
+    room_pool: Optional[RoomPool] = Depends(get_room_pool),
+    room_provisioner: Optional[RoomProvisioner] = Depends(get_async_room_provisioner)
 ):
-    """Create interview via API key (for integrations)"""
-    db_interview = create_interview_crud(db=db, interview=interview, user_id=current_user.id)
-    
-    room_created = await livekit_manager.create_room(
-        room_name=db_interview.room_name,
-        empty_timeout=1800  # 30 minutes
+    """Create interview via API key (for integrations); honours ``Prefer: respond-async``"""
+    db_interview = await _create_interview_with_room(
+        db, interview, current_user.id, livekit_manager, room_pool, room_provisioner
     )
-    
-    if not room_created:
-        update_interview_crud(
-            db, 
-            db_interview.id, 
-            interview_schemas.InterviewUpdate(status="room_creation_failed")
-        )
-    
+    _accepted(response, request, db_interview, "api_get_interview_status")
     return db_interview
 
+@router.post("/api/bulk", response_model=interview_schemas.InterviewBulkResult)
+async def api_bulk_create_interviews(
+    payload: interview_schemas.InterviewBulkCreate,
+    current_user = Depends(get_api_key_user),
+    db: AsyncSession = Depends(get_db),
+    livekit_manager: LiveKitManager = Depends(get_livekit_manager),
+    room_pool: Optional[RoomPool] = Depends(get_room_pool)
+):
+    """Create a batch of interviews via API key (for integrations)"""
+    return await _bulk_create_interviews(db, payload, current_user.id, livekit_manager, room_pool)
+
+@router.get("/api/export")
+async def api_export_interviews(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    status_filter: Optional[str] = Query(None, alias="status"),
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    current_user = Depends(get_api_key_user)
+):
+    """Stream interviews with results via API key (for integrations)"""
+    return _export_interviews(current_user, format, status_filter, created_from, created_to)
+
+@router.get("/api/{interview_id}/status", response_model=interview_schemas.InterviewStatus)
+async def api_get_interview_status(
+    interview_id: str,
+    current_user = Depends(get_api_key_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Current interview status via API key"""
+    row = await _interview_status(db, interview_id, current_user, allow_superuser=False)
+    return interview_schemas.InterviewStatus(id=interview_id, status=row.status)
+
+@router.get("/api/{interview_id}/status/events")
+async def api_interview_status_events(
+    interview_id: str,
+    current_user = Depends(get_api_key_user),
+    db: AsyncSession = Depends(get_db),
+    room_provisioner: Optional[RoomProvisioner] = Depends(get_room_provisioner)
+):
+    """Server-sent status events via API key"""
+    await _interview_status(db, interview_id, current_user, allow_superuser=False)
+    return _status_events(interview_id, room_provisioner)
+
 @router.post("/api/{interview_id}/token", response_model=interview_schemas.InterviewToken)
 async def api_generate_interview_token(
     interview_id: str,
     current_user = Depends(get_api_key_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     livekit_manager: LiveKitManager = Depends(get_livekit_manager)
 ):
     """Generate interview token via API key"""
-    db_interview = get_interview_crud(db, interview_id=interview_id)
+    db_interview = await get_interview_crud(db, interview_id=interview_id)
     
     if not db_interview or db_interview.creator_id != current_user.id:
         raise HTTPException(
@@ -180,7 +577,8 @@ async def api_generate_interview_token(
     token = livekit_manager.generate_token(
         room_name=db_interview.room_name,
         participant_name=db_interview.candidate_name,
-        identity=f"candidate-{db_interview.id}"
+        identity=f"candidate-{db_interview.id}",
+        revision=db_interview.status
     )
     
     return interview_schemas.InterviewToken(
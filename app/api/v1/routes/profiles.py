@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from typing import List
+
+from app.api.deps import get_current_superuser
+from app.core.profiling import profile_store
+from app.schemas.profile import ProfileInfo
+
+router = APIRouter()
+
+@router.get("/", response_model=List[ProfileInfo])
+async def list_profiles(current_user = Depends(get_current_superuser)):
+    """List stored request profiles on this worker, newest first"""
+    return profile_store.list()
+
+@router.get("/{profile_id}")
+async def get_profile(profile_id: str, current_user = Depends(get_current_superuser)):
+    """Download a profile as speedscope JSON (open it at https://www.speedscope.app)"""
+    path = profile_store.path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=f"{profile_id}.speedscope.json")
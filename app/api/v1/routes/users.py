@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.crud.users import create_user, get_user_by_email, get_user_by_username, authenticate_user
 from app.schemas import user as user_schemas
 from app.db.database import get_db
 from app.api.deps import get_current_active_user
+from app.core.auth_cache import auth_cache
 
 router = APIRouter()
 
@@ -18,7 +19,7 @@ async def read_users_me(current_user = Depends(get_current_active_user)):
 async def update_user_me(
     user_update: user_schemas.UserUpdate,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update current user profile"""
     if user_update.full_name is not None:
@@ -26,6 +27,7 @@ async def update_user_me(
     if user_update.is_active is not None and current_user.is_superuser:
         current_user.is_active = user_update.is_active
     
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    auth_cache.invalidate_user(current_user.id)
     return current_user
\ No newline at end of file
@@ -0,0 +1,66 @@
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLLRUCache
+from app.db import models
+
+
+class AuthContextCache:
+    """Bounded LRU of resolved users keyed by token jti.
+
+    Entries live for at most ``ttl_seconds`` and never outlive the token's own
+    ``exp``. Cached users are detached column snapshots; callers re-attach them
+    to their session with ``Session.merge(user, load=False)``, which costs no SQL.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._cache: TTLLRUCache[str, models.User] = TTLLRUCache(max_entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled and self.ttl_seconds > 0
+
+    def get(self, jti: str) -> Optional[models.User]:
+        """Return the cached user snapshot for a token, or None"""
+        if not self.enabled:
+            return None
+        return self._cache.get(jti)
+
+    def set(self, jti: str, user: models.User, token_exp: int) -> None:
+        """Cache a detached snapshot of ``user`` until min(TTL, token exp)"""
+        if not self.enabled:
+            return
+        expires_at = min(time.time() + self.ttl_seconds, float(token_exp))
+        self._cache.set(jti, _snapshot_user(user), expires_at)
+
+    def invalidate_token(self, jti: str) -> None:
+        self._cache.invalidate(jti)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached token that resolved to ``user_id``"""
+        self._cache.invalidate_where(lambda _, user: user.id == user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+def _snapshot_user(user: models.User) -> models.User:
+    """Copy loaded column values into a detached instance safe to share across sessions"""
+    columns = inspect(models.User).column_attrs
+    snapshot = models.User(**{attr.key: getattr(user, attr.key) for attr in columns})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+auth_cache = AuthContextCache(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+)
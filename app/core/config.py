@@ -8,16 +8,112 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./ai_interview.db"
+    # Engine profile: auto (pick from DATABASE_URL), sqlite, postgres or default
+    DB_ENGINE_PROFILE: str = "auto"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # SQLAlchemy compiled-statement cache and asyncpg prepared-statement cache sizes
+    DB_QUERY_CACHE_SIZE: int = 500
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # Local-dev shortcut: create missing tables at startup. Off by default; the
+    # schema is managed with `alembic upgrade head`, run once per deploy
+    DB_CREATE_TABLES_ON_STARTUP: bool = False
     
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-prod"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # Resolved-user cache for get_current_user. Set either value to 0 to disable.
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 30
+    # Max concurrent bcrypt operations per worker (run off the event loop)
+    PASSWORD_HASH_MAX_WORKERS: int = 4
+    # Verify unknown emails against a dummy hash so login timing does not
+    # reveal which accounts exist. Disable to reject them immediately.
+    LOGIN_CONSTANT_TIME_REJECT: bool = True
+    # How often each worker pulls tokens revoked by other workers into memory
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 5
     
     # LiveKit Configuration
     LIVEKIT_URL: str = ""
     LIVEKIT_API_KEY: str = ""
     LIVEKIT_API_SECRET: str = ""
+    # Shared LiveKit API client: connection pool, per-attempt timeouts and retries
+    LIVEKIT_MAX_CONNECTIONS: int = 20
+    LIVEKIT_KEEPALIVE_SECONDS: int = 60
+    LIVEKIT_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    LIVEKIT_REQUEST_TIMEOUT_SECONDS: float = 5.0
+    LIVEKIT_MAX_RETRIES: int = 2
+    LIVEKIT_RETRY_BASE_SECONDS: float = 0.2
+    LIVEKIT_RETRY_MAX_SECONDS: float = 2.0
+    # Participant tokens: lifetime, and reuse of a cached token until less than
+    # LIVEKIT_TOKEN_MIN_REMAINING_SECONDS of it is left (0 entries disables the cache)
+    LIVEKIT_TOKEN_TTL_SECONDS: int = 7200
+    LIVEKIT_TOKEN_MIN_REMAINING_SECONDS: int = 1800
+    LIVEKIT_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    # Bulk interview creation: batch size cap and concurrent room provisioning
+    BULK_INTERVIEW_MAX_ITEMS: int = 500
+    BULK_ROOM_PROVISION_CONCURRENCY: int = 10
+    # Rows fetched per server-side cursor batch when streaming exports
+    INTERVIEW_EXPORT_BATCH_SIZE: int = 500
+    # Warm pool of pre-created rooms per worker (0 disables); pooled rooms are
+    # recycled after ROOM_POOL_MAX_AGE_SECONDS so a claimed room still has
+    # EMPTY_TIMEOUT - MAX_AGE seconds before LiveKit closes it
+    ROOM_POOL_TARGET_SIZE: int = 5
+    ROOM_POOL_LOW_WATER: int = 2
+    ROOM_POOL_EMPTY_TIMEOUT_SECONDS: int = 3600
+    ROOM_POOL_MAX_AGE_SECONDS: int = 1800
+    ROOM_POOL_REFILL_SECONDS: int = 30
+    # Logging: "text" (colored, written inline; for development) or "json"
+    # (records queued and written by a background thread, never blocking the
+    # event loop; full queue drops records). DEBUG records are sampled 1 in N
+    LOG_FORMAT: str = "text"
+    LOG_LEVEL: str = "INFO"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_DEBUG_SAMPLE_RATE: int = 1
+    # Prometheus metrics middleware and /metrics endpoint. With several workers
+    # also set the PROMETHEUS_MULTIPROC_DIR environment variable (see README)
+    METRICS_ENABLED: bool = True
+    # Request profiling (pyinstrument, speedscope output): superusers can profile
+    # one request with "X-Profile: 1"; PROFILE_SAMPLE_RATE=N also profiles 1 in N
+    # requests (0 disables). Only the newest PROFILE_MAX_FILES (at least 1) profiles are kept
+    PROFILING_ENABLED: bool = True
+    PROFILE_SAMPLE_RATE: int = 0
+    PROFILE_INTERVAL_SECONDS: float = 0.001
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_FILES: int = Field(200, ge=1)
+    # Readiness probes: dependency checks are cached for HEALTH_PROBE_CACHE_SECONDS
+    # and time out after HEALTH_PROBE_TIMEOUT_SECONDS; a worker whose DB pool is
+    # at least this saturated (checked out / capacity) reports not ready
+    HEALTH_PROBE_CACHE_SECONDS: float = 2.0
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_POOL_SATURATION_THRESHOLD: float = 1.0
+    # Background room creation for interviews created with "Prefer: respond-async":
+    # attempts per room (jittered backoff between them), workers and queue bound
+    ROOM_PROVISIONING_MAX_ATTEMPTS: int = 5
+    ROOM_PROVISIONING_RETRY_BASE_SECONDS: float = 1.0
+    ROOM_PROVISIONING_RETRY_MAX_SECONDS: float = 10.0
+    ROOM_PROVISIONING_CONCURRENCY: int = 10
+    ROOM_PROVISIONING_QUEUE_SIZE: int = 1000
+    # Interviews still "provisioning" after ROOM_PROVISIONING_STALE_SECONDS (their
+    # worker restarted or died) are claimed by one worker and provisioned again;
+    # each worker looks for them at startup and every ROOM_PROVISIONING_RECOVERY_SECONDS
+    ROOM_PROVISIONING_STALE_SECONDS: float = 300.0
+    ROOM_PROVISIONING_RECOVERY_SECONDS: float = 60.0
+    
+    # Agent write-behind checkpointing: session results are written to the
+    # interview at most this often (and at phase changes, completion and exit)
+    AGENT_CHECKPOINT_INTERVAL_SECONDS: float = 5.0
+    
+    # Agent interview config lookup by room name: per-process cache lifetime
+    # and size, and how long a job waits for the lookup before using defaults
+    AGENT_CONFIG_CACHE_TTL_SECONDS: float = 30.0
+    AGENT_CONFIG_CACHE_MAX_ENTRIES: int = 1000
+    AGENT_CONFIG_LOOKUP_TIMEOUT_SECONDS: float = 2.0
     
     # AI Services
     GOOGLE_API_KEY: Optional[str] 
@@ -28,6 +124,9 @@ class Settings(BaseSettings):
     # Application Settings
     API_KEY_PREFIX: str = "sk_"
     MAX_API_KEYS_PER_USER: int = 3
+    # API key usage counters are buffered in memory and written in batches
+    API_KEY_USAGE_FLUSH_SECONDS: int = 10
+    API_KEY_USAGE_MAX_BUFFERED_KEYS: int = 1000
     # Comma-separated list of allowed origins for CORS. Use "*" for all (dev only).
     ALLOWED_ORIGINS: str = "*"
     
@@ -0,0 +1,54 @@
+import hashlib
+from typing import Iterable, Optional
+
+# Sent with ETags so browsers revalidate (If-None-Match) instead of reusing a stale copy
+CACHE_CONTROL = "private, no-cache"
+
+
+def _digest(parts: Iterable[str]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\x00")
+    return f'"{h.hexdigest()}"'
+
+
+def _version(row) -> str:
+    stamp = row.updated_at or row.created_at
+    return f"{row.id}@{stamp.isoformat() if stamp else ''}"
+
+
+def interview_etag(interview, fields: str = "summary") -> str:
+    """Strong ETag for one interview from its id and updated_at (created_at
+    until first updated) and the representation (``fields``: summary or full),
+    since a strong validator must differ between representations. Accepts an
+    ORM object or a row with those columns."""
+    return _digest([f"fields={fields}", _version(interview)])
+
+
+def collection_etag(rows, has_more: bool, fields: str = "summary") -> str:
+    """Strong ETag for a page of interviews in the ``fields`` representation:
+    changes when any row on the page changes, rows join or leave the page,
+    or a next page appears."""
+    return _digest([f"fields={fields}", *(_version(row) for row in rows), f"more={has_more}"])
+
+
+def etag_in(header: Optional[str], etag: str, strong: bool = False) -> bool:
+    """Whether an If-None-Match / If-Match header value matches ``etag``.
+
+    ``strong`` selects the strong comparison If-Match requires, where weak
+    (W/) validators never match.
+    """
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if strong:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.engine_profiles import pool_usage
+
+
+class CachedCheck:
+    """Runs an async dependency check at most once per ``ttl_seconds``.
+
+    Callers within the TTL get the cached result, and concurrent callers
+    share one in-flight run, so however often probes arrive the dependency
+    sees at most one check per TTL per worker.
+    """
+
+    def __init__(self, check: Callable[[], Awaitable[None]], ttl_seconds: float, timeout_seconds: float):
+        self._check = check
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self._lock = asyncio.Lock()
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+
+    def _fresh(self) -> bool:
+        return self._result is not None and time.monotonic() - self._checked_at < self.ttl_seconds
+
+    async def run(self) -> Dict[str, Any]:
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    start = time.perf_counter()
+                    error = None
+                    try:
+                        await asyncio.wait_for(self._check(), timeout=self.timeout_seconds)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        error = repr(e)
+                    self._result = {
+                        "ok": error is None,
+                        "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+                        "error": error,
+                    }
+                    self._checked_at = time.monotonic()
+        return {**self._result, "age_seconds": round(time.monotonic() - self._checked_at, 3)}
+
+
+class ReadinessProbe:
+    """Database and LiveKit checks behind /health/ready.
+
+    The worker is ready while the database answers (a pool checkout plus
+    ``SELECT 1``) and its pool is below ``saturation_threshold``. LiveKit is
+    probed too, but an outage only marks the worker "degraded": LiveKit is
+    shared by every worker, so failing readiness on it would take the whole
+    API out of rotation for something no single worker can fix.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        livekit_manager,
+        cache_seconds: float,
+        timeout_seconds: float,
+        saturation_threshold: float,
+    ):
+        self.engine = engine
+        self.livekit_manager = livekit_manager
+        self.saturation_threshold = saturation_threshold
+        self.database = CachedCheck(self._check_database, cache_seconds, timeout_seconds)
+        self.livekit = CachedCheck(livekit_manager.ping, cache_seconds, timeout_seconds)
+
+    async def _check_database(self) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def check(self) -> Tuple[str, Dict[str, Any]]:
+        """("ready" | "degraded" | "not_ready", report)"""
+        if self.livekit_manager.is_configured:
+            database, livekit = await asyncio.gather(self.database.run(), self.livekit.run())
+        else:
+            database, livekit = await self.database.run(), {"ok": None, "error": "not configured"}
+        pool = pool_usage(self.engine.sync_engine)
+        saturated = pool["saturation"] is not None and pool["saturation"] >= self.saturation_threshold
+
+        if not database["ok"] or saturated:
+            state = "not_ready"
+        elif livekit["ok"] is False:
+            state = "degraded"
+        else:
+            state = "ready"
+        return state, {
+            "status": state,
+            "checks": {"database": database, "livekit": livekit},
+            "database_pool": {**pool, "saturated": saturated},
+        }
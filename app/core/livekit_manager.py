@@ -1,34 +1,218 @@
+import asyncio
 import jwt
+import logging
+import random
+import threading
 import time
-from typing import Dict, Any, Optional
-from livekit.api import LiveKitAPI, CreateRoomRequest, ListRoomsRequest
+from collections import deque
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Dict, Any, Optional, TypeVar
+
 from app.core.config import settings
+from app.core.metrics import LIVEKIT_CALL_SECONDS
+from app.core.token_cache import ParticipantTokenCache
 import uuid
 
+# The LiveKit SDK and aiohttp are imported on first use, not with this module:
+# together they are a quarter of the API's import time
+if TYPE_CHECKING:
+    import aiohttp
+    from livekit.api import LiveKitAPI
+
+logger = logging.getLogger("app")
+
+T = TypeVar("T")
+
+# Twirp error codes worth another attempt; anything else (already_exists,
+# permission_denied, ...) fails straight away
+RETRYABLE_TWIRP_CODES = {"unavailable", "deadline_exceeded", "resource_exhausted", "internal", "unknown"}
+
+
+class CallLatencyStats:
+    """Latency and outcome counters for LiveKit API calls, per operation"""
+
+    def __init__(self, window: int = 512):
+        self._window = window
+        self._lock = threading.Lock()
+        self._ops: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, operation: str, seconds: float, ok: bool, attempts: int) -> None:
+        with self._lock:
+            op = self._ops.setdefault(operation, {
+                "calls": 0, "errors": 0, "retries": 0,
+                "total_seconds": 0.0, "max_seconds": 0.0,
+                "recent": deque(maxlen=self._window),
+            })
+            op["calls"] += 1
+            op["errors"] += 0 if ok else 1
+            op["retries"] += attempts - 1
+            op["total_seconds"] += seconds
+            op["max_seconds"] = max(op["max_seconds"], seconds)
+            op["recent"].append(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            result = {}
+            for name, op in self._ops.items():
+                recent = sorted(op["recent"])
+                result[name] = {
+                    "calls": op["calls"],
+                    "errors": op["errors"],
+                    "retries": op["retries"],
+                    "avg_ms": round(op["total_seconds"] / op["calls"] * 1000, 2),
+                    "max_ms": round(op["max_seconds"] * 1000, 2),
+                    "p50_ms": round(_percentile(recent, 0.50) * 1000, 2),
+                    "p95_ms": round(_percentile(recent, 0.95) * 1000, 2),
+                }
+            return result
+
+
+def _percentile(sorted_values: Deque[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def _is_retryable(exc: Exception) -> bool:
+    import aiohttp
+    from livekit.api import TwirpError
+
+    if isinstance(exc, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+        return True
+    if isinstance(exc, TwirpError):
+        return getattr(exc, "code", None) in RETRYABLE_TWIRP_CODES or getattr(exc, "status", 0) >= 500
+    return False
+
+
 class LiveKitManager:
-    """LiveKit integration manager"""
-    
+    """LiveKit integration manager.
+
+    Owns one long-lived ``LiveKitAPI`` client (and its HTTP connection pool),
+    opened by ``start()`` in the app lifespan and closed by ``aclose()``.
+    """
+
     def __init__(self):
         self.api_key = settings.LIVEKIT_API_KEY
         self.api_secret = settings.LIVEKIT_API_SECRET
         self.server_url = settings.LIVEKIT_URL
-        
-        if not all([self.api_key, self.api_secret, self.server_url]):
+        self.stats = CallLatencyStats()
+        self.token_cache = ParticipantTokenCache(
+            max_entries=settings.LIVEKIT_TOKEN_CACHE_MAX_ENTRIES,
+            min_remaining_seconds=settings.LIVEKIT_TOKEN_MIN_REMAINING_SECONDS,
+        )
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._api: Optional["LiveKitAPI"] = None
+
+        if not self.is_configured:
             print("⚠️  Warning: LiveKit credentials not configured")
-    
+
+    @property
+    def is_configured(self) -> bool:
+        return all([self.api_key, self.api_secret, self.server_url])
+
+    async def start(self) -> None:
+        """Open the shared HTTP session and API client"""
+        if self._api is not None or not self.is_configured:
+            return
+        import aiohttp
+        from livekit.api import LiveKitAPI
+
+        connector = aiohttp.TCPConnector(
+            limit=settings.LIVEKIT_MAX_CONNECTIONS,
+            keepalive_timeout=settings.LIVEKIT_KEEPALIVE_SECONDS,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=settings.LIVEKIT_REQUEST_TIMEOUT_SECONDS,
+                connect=settings.LIVEKIT_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+        self._api = LiveKitAPI(
+            url=self.server_url,
+            api_key=self.api_key,
+            api_secret=self.api_secret,
+            session=self._session,
+        )
+
+    async def aclose(self) -> None:
+        """Close the API client and its HTTP session"""
+        api, session = self._api, self._session
+        self._api, self._session = None, None
+        if api is not None:
+            await api.aclose()
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _client(self) -> "LiveKitAPI":
+        if self._api is None:
+            await self.start()
+        return self._api
+
+    async def _call(
+        self, operation: str, request: Callable[["LiveKitAPI"], Awaitable[T]], max_retries: Optional[int] = None
+    ) -> T:
+        """Run one API request with a per-attempt timeout and jittered retries
+        (``LIVEKIT_MAX_RETRIES`` unless ``max_retries`` is given)"""
+        if max_retries is None:
+            max_retries = settings.LIVEKIT_MAX_RETRIES
+        api = await self._client()
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = await asyncio.wait_for(request(api), timeout=settings.LIVEKIT_REQUEST_TIMEOUT_SECONDS)
+            except Exception as e:
+                if attempt > max_retries or not _is_retryable(e):
+                    elapsed = time.perf_counter() - start
+                    self.stats.observe(operation, elapsed, ok=False, attempts=attempt)
+                    LIVEKIT_CALL_SECONDS.labels(operation, "error").observe(elapsed)
+                    raise
+                # Full jitter: sleep a random amount up to the exponential backoff cap
+                backoff = min(settings.LIVEKIT_RETRY_MAX_SECONDS, settings.LIVEKIT_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+                await asyncio.sleep(random.uniform(0, backoff))
+                continue
+            elapsed = time.perf_counter() - start
+            self.stats.observe(operation, elapsed, ok=True, attempts=attempt)
+            LIVEKIT_CALL_SECONDS.labels(operation, "ok").observe(elapsed)
+            return result
+
+    async def ping(self) -> None:
+        """Round-trip to the LiveKit API; raises if it fails.
+
+        Lists rooms filtered to a name that is never used, so the reply stays
+        empty however many rooms exist.
+        """
+        from livekit.api import ListRoomsRequest
+
+        await self._call("ping", lambda api: api.room.list_rooms(ListRoomsRequest(names=["health-check"])))
+
     def generate_token(
-        self, 
-        room_name: str, 
-        participant_name: str, 
+        self,
+        room_name: str,
+        participant_name: str,
         identity: Optional[str] = None,
-        permissions: Optional[Dict[str, Any]] = None
+        permissions: Optional[Dict[str, Any]] = None,
+        revision: Optional[str] = None,
     ) -> str:
-        """Generate LiveKit JWT token"""
-        if not identity:
+        """Generate LiveKit JWT token.
+
+        Tokens for an explicit ``identity`` are reused from the token cache
+        while enough lifetime remains; ``revision`` (e.g. the interview status)
+        is part of the cache key, so a changed revision gets a fresh token.
+        """
+        cache_key = None
+        if identity:
+            cache_key = self.token_cache.key(room_name, identity, participant_name, permissions, revision)
+            cached = self.token_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        else:
             identity = f"participant_{uuid.uuid4().hex[:8]}"
-        
+
         current_time = int(time.time())
-        
+        expires_at = current_time + settings.LIVEKIT_TOKEN_TTL_SECONDS
+
         # Default permissions
         default_permissions = {
             "roomJoin": True,
@@ -37,15 +221,15 @@ class LiveKitManager:
             "canPublishData": True,
             "canUpdateOwnMetadata": True
         }
-        
+
         if permissions:
             default_permissions.update(permissions)
-        
+
         payload = {
             "iss": self.api_key,
             "sub": identity,
             "iat": current_time,
-            "exp": current_time + 7200,  # 2 hours
+            "exp": expires_at,
             "nbf": current_time,
             "name": participant_name,
             "video": {
@@ -53,50 +237,58 @@ class LiveKitManager:
                 **default_permissions
             }
         }
-        
+
         token = jwt.encode(payload, self.api_secret, algorithm="HS256")
+        if cache_key is not None:
+            self.token_cache.set(cache_key, token, expires_at)
         return token
-    
-    async def create_room(self, room_name: str, empty_timeout: int = 300) -> bool:
-        """Create LiveKit room"""
+
+    async def create_room(self, room_name: str, empty_timeout: int = 300, retry: bool = True) -> bool:
+        """Create LiveKit room. ``retry=False`` makes a single attempt, for
+        callers that run their own retry loop."""
         try:
-            if not self.api_key or not self.api_secret or not self.server_url:
+            if not self.is_configured:
                 return False
-                
-            lk_api = LiveKitAPI(
-                base_url=self.server_url,
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-            )
-            
+            from livekit.api import CreateRoomRequest
+
             create_request = CreateRoomRequest(
                 name=room_name,
                 empty_timeout=empty_timeout,
                 max_participants=10
             )
-            
-            await lk_api.room.create_room(create_request)
-            await lk_api.aclose()
+
+            await self._call(
+                "create_room", lambda api: api.room.create_room(create_request), max_retries=None if retry else 0
+            )
             return True
-            
+
         except Exception as e:
-            print(f"Error creating room: {e}")
+            logger.warning(f"Error creating room {room_name}: {e!r}")
             return False
-    
+
+    async def delete_room(self, room_name: str) -> bool:
+        """Delete LiveKit room"""
+        try:
+            if not self.is_configured:
+                return False
+            from livekit.api import DeleteRoomRequest
+
+            await self._call("delete_room", lambda api: api.room.delete_room(DeleteRoomRequest(room=room_name)))
+            return True
+
+        except Exception as e:
+            logger.warning(f"Error deleting room {room_name}: {e!r}")
+            return False
+
     async def list_rooms(self) -> list:
         """List active LiveKit rooms"""
         try:
-            if not self.api_key or not self.api_secret or not self.server_url:
+            if not self.is_configured:
                 return []
-                
-            lk_api = LiveKitAPI(
-                base_url=self.server_url,
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-            )
-            rooms = await lk_api.room.list_rooms(ListRoomsRequest())
-            await lk_api.aclose()
-            
+            from livekit.api import ListRoomsRequest
+
+            rooms = await self._call("list_rooms", lambda api: api.room.list_rooms(ListRoomsRequest()))
+
             return [
                 {
                     "name": room.name,
@@ -105,7 +297,7 @@ class LiveKitManager:
                 }
                 for room in rooms.rooms
             ]
-            
+
         except Exception as e:
-            print(f"Error listing rooms: {e}")
+            logger.warning(f"Error listing rooms: {e!r}")
             return []
@@ -1,10 +1,156 @@
+import atexit
+import itertools
+import json
 import logging
-import coloredlogs
+import logging.handlers
+import queue
 import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.request_context import interview_id_var, request_id_var
+
+# Attributes every LogRecord has; anything else was passed via ``extra=`` and
+# is emitted as a field of the JSON record
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["NonBlockingQueueHandler"] = None
+_atexit_registered = False
+
+
+class ContextFilter(logging.Filter):
+    """Stamp records with the request and interview correlation ids.
+
+    Must run in the thread that logs (i.e. on the queue handler), since the
+    ids live in context variables the listener thread cannot see.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        record.interview_id = interview_id_var.get()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Pass 1 in ``rate`` DEBUG records; other levels always pass"""
+
+    def __init__(self, rate: int):
+        super().__init__()
+        self.rate = max(1, rate)
+        self._counter = itertools.count()
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate == 1:
+            return True
+        if next(self._counter) % self.rate == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks or formats in the caller.
+
+    Records go onto a bounded queue as they are; message formatting and JSON
+    encoding happen on the listener thread. When the queue is full the record
+    is dropped and counted rather than waiting for the writer to catch up.
+    Arguments are formatted later, on the listener thread: pass values that
+    are not mutated after the call, or format them into the message up front.
+    """
+
+    def __init__(self, log_queue: "queue.Queue", sampling: DebugSamplingFilter):
+        super().__init__(log_queue)
+        self.sampling = sampling
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped,
+            "debug_sampled_out": self.sampling.sampled_out,
+        }
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with timestamp, level, logger, message,
+    correlation ids, exception text and any ``extra=`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "interview_id": getattr(record, "interview_id", None),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in entry:
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+def logging_stats() -> Dict[str, int]:
+    """Queue depth and records dropped or sampled out (JSON mode only)"""
+    return _queue_handler.stats() if _queue_handler else {}
+
+
+def _stop_listener() -> None:
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener = None
+        _queue_handler = None
+
+
+def _setup_json_logging(level: str, queue_size: int, debug_sample_rate: int) -> None:
+    global _listener, _queue_handler, _atexit_registered
+    _stop_listener()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    sampling = DebugSamplingFilter(debug_sample_rate)
+    _queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size), sampling)
+    _queue_handler.addFilter(sampling)
+    _queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    if not _atexit_registered:
+        # Flush queued records on interpreter exit
+        atexit.register(_stop_listener)
+        _atexit_registered = True
+
+
+def _setup_text_logging(level: str) -> None:
+    import coloredlogs
+
+    _stop_listener()
 
-def setup_logging():
-    """Set up centralized, colored logging for the application."""
-    
     # Define custom color styles
     level_styles = {
         'debug': {'color': 'white'},
@@ -13,7 +159,7 @@ def setup_logging():
         'error': {'color': 'red'},
         'critical': {'color': 'red', 'bold': True},
     }
-    
+
     # Define custom field styles
     field_styles = {
         'asctime': {'color': 'cyan'},
@@ -25,15 +171,33 @@ def setup_logging():
     }
 
     coloredlogs.install(
-        level='INFO',
+        level=level,
         stream=sys.stdout,
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         level_styles=level_styles,
         field_styles=field_styles
     )
 
-    # Make uvicorn use the root logger configuration to avoid duplicate logs
-    logging.getLogger("uvicorn.access").handlers = []
-    logging.getLogger("uvicorn.error").handlers = []
-    logging.getLogger("uvicorn.access").propagate = True
-    logging.getLogger("uvicorn.error").propagate = True
\ No newline at end of file
+
+def setup_logging():
+    """Set up centralized logging for the application.
+
+    ``LOG_FORMAT=text`` (default) writes colored lines straight to stdout for
+    local development. ``LOG_FORMAT=json`` is the production mode: loggers
+    only enqueue records, and a listener thread formats them as JSON and
+    writes them, so logging never blocks the event loop.
+
+    Called from the app lifespan rather than at import, so importing the app
+    (tools, migrations, tests) leaves logging alone.
+    """
+    if settings.LOG_FORMAT == "json":
+        _setup_json_logging(settings.LOG_LEVEL, settings.LOG_QUEUE_SIZE, settings.LOG_DEBUG_SAMPLE_RATE)
+    else:
+        _setup_text_logging(settings.LOG_LEVEL)
+
+    # Make uvicorn use the root logger configuration to avoid duplicate logs.
+    # Includes the parent "uvicorn" logger: its own stderr handler would
+    # otherwise write access logs inline, bypassing the queue
+    for name in ("uvicorn", "uvicorn.access", "uvicorn.error"):
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
@@ -0,0 +1,156 @@
+"""
+Prometheus metrics for the API.
+
+With several uvicorn workers, set ``PROMETHEUS_MULTIPROC_DIR`` in the
+environment (an empty directory, wiped before the workers start) so every
+worker writes its samples there and ``/metrics`` on any worker reports the
+sum over all of them. Without it each worker reports only itself.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Route label for requests that match no route, so unknown paths cannot
+# create new time series
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status", ["method", "route", "status"]
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served", ["method"], multiprocess_mode="livesum"
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Database queries issued per HTTP request", ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "Time spent in database queries per HTTP request", ["route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+LIVEKIT_CALL_SECONDS = Histogram(
+    "livekit_call_duration_seconds", "LiveKit API call latency including retries", ["operation", "outcome"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_duration_seconds", "bcrypt hashing and verification time", ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0),
+)
+
+# [queries, seconds] for the database work of the request being served
+_request_db: ContextVar[Optional[List[float]]] = ContextVar("request_db", default=None)
+
+
+def install_db_metrics(engine: Engine) -> None:
+    """Count queries and their time towards the current request.
+
+    For async engines pass ``async_engine.sync_engine``.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        totals = _request_db.get()
+        if totals is not None:
+            totals[0] += 1
+            totals[1] += time.perf_counter() - context._metrics_start
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the route that served the request, e.g.
+    /api/v1/interviews/{interview_id}.
+
+    Read from the scope after routing: the route records its own path, so the
+    router prefix is recovered from the request path.
+    """
+    route = scope.get("route")
+    if route is None or not hasattr(route, "path_format"):
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    try:
+        suffix = route.path_format.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return route.path_format
+    if suffix and path.endswith(suffix):
+        return path[: len(path) - len(suffix)] + route.path_format
+    return route.path_format
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware recording request count, latency, in-flight
+    requests and per-request database work, labelled by route template."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        totals = [0, 0.0]
+        token = _request_db.set(totals)
+        in_progress = HTTP_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            _request_db.reset(token)
+            route = route_template(scope)
+            HTTP_REQUEST_SECONDS.labels(method, route).observe(elapsed)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            REQUEST_DB_QUERIES.labels(route).observe(totals[0])
+            REQUEST_DB_SECONDS.labels(route).observe(totals[1])
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition-format metrics and their content type, summed over workers in multiprocess mode"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the shared multiprocess directory on shutdown"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,181 @@
+"""
+Request profiling with pyinstrument (a statistical profiler: it samples the
+stack every ``interval`` seconds instead of tracing every call).
+
+Two modes, both writing speedscope JSON (open at https://www.speedscope.app)
+to a directory that keeps only the newest ``max_files`` profiles:
+
+- on demand: a superuser sends ``X-Profile: 1`` (or ``?profile=1``); the
+  response carries ``X-Profile-Id`` to fetch it from ``/api/v1/profiles``
+- sampled: every request is profiled with probability 1/N
+
+pyinstrument is imported on first use so workers that never profile do not
+pay for it at startup.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger("app")
+
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_SUFFIX = ".speedscope.json"
+
+_TRUTHY = {"1", "true", "yes", "on"}
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ProfileStore:
+    """Directory of profiles named ``<epoch ms>-<method>-<route>-<id>.speedscope.json``
+    so name order is age order; the oldest beyond ``max_files`` are deleted."""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+
+    def _files(self) -> List[str]:
+        try:
+            return sorted(name for name in os.listdir(self.directory) if name.endswith(PROFILE_SUFFIX))
+        except FileNotFoundError:
+            return []
+
+    def write(self, profile_id: str, method: str, route: str, data: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        slug = _UNSAFE.sub("_", route.strip("/")).strip("_") or "root"
+        name = f"{int(time.time() * 1000)}-{method}-{slug}-{profile_id}{PROFILE_SUFFIX}"
+        tmp = os.path.join(self.directory, f".{name}.tmp")
+        with open(tmp, "w") as f:
+            f.write(data)
+        os.replace(tmp, os.path.join(self.directory, name))
+        files = self._files()
+        stale = files[: len(files) - self.max_files] if len(files) > self.max_files else []
+        for old in stale:
+            try:
+                os.remove(os.path.join(self.directory, old))
+            except FileNotFoundError:
+                pass
+        return name
+
+    def list(self) -> List[Dict[str, object]]:
+        """Stored profiles, newest first"""
+        profiles = []
+        for name in reversed(self._files()):
+            stamp, method, rest = name[: -len(PROFILE_SUFFIX)].split("-", 2)
+            slug, profile_id = rest.rsplit("-", 1)
+            profiles.append({
+                "id": profile_id,
+                "method": method,
+                "route": slug,
+                "created_at_ms": int(stamp),
+                "file": name,
+            })
+        return profiles
+
+    def path(self, profile_id: str) -> Optional[str]:
+        """File of a stored profile, None if unknown or already rotated out"""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        suffix = f"-{profile_id}{PROFILE_SUFFIX}"
+        for name in self._files():
+            if name.endswith(suffix):
+                return os.path.join(self.directory, name)
+        return None
+
+
+profile_store = ProfileStore(settings.PROFILE_DIR, settings.PROFILE_MAX_FILES)
+
+
+def _requested(scope: Scope) -> bool:
+    for key, value in scope["headers"]:
+        if key == b"x-profile":
+            return value.decode("latin-1").strip().lower() in _TRUTHY
+    query = scope.get("query_string", b"")
+    if PROFILE_QUERY_PARAM.encode() in query:
+        values = parse_qs(query.decode("latin-1")).get(PROFILE_QUERY_PARAM, [])
+        return any(value.lower() in _TRUTHY for value in values)
+    return False
+
+
+def _bearer_token(scope: Scope) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            return token.strip() if scheme.lower() == "bearer" and token else None
+    return None
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware profiling single requests on demand (superusers
+    only, checked by ``authorize(token)``) and 1 in ``sample_rate`` requests."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        authorize: Callable[[str], Awaitable[bool]],
+        store: ProfileStore = profile_store,
+        sample_rate: int = 0,
+        interval: float = 0.001,
+    ):
+        self.app = app
+        self.authorize = authorize
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval = interval
+
+    async def _on_demand(self, scope: Scope) -> bool:
+        if not _requested(scope):
+            return False
+        token = _bearer_token(scope)
+        return token is not None and await self.authorize(token)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        on_demand = await self._on_demand(scope)
+        if not on_demand and not (self.sample_rate > 0 and random.random() * self.sample_rate < 1):
+            await self.app(scope, receive, send)
+            return
+
+        from pyinstrument import Profiler
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if on_demand and message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER.lower().encode(), profile_id.encode())]
+            await send(message)
+
+        # async_mode="enabled" attributes only this request's task, even with
+        # other requests interleaved on the event loop
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            try:
+                await asyncio.to_thread(self._save, profiler, profile_id, scope)
+            except Exception:
+                logger.exception(f"Saving profile {profile_id} failed")
+
+    def _save(self, profiler, profile_id: str, scope: Scope) -> None:
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        data = profiler.output(SpeedscopeRenderer())
+        self.store.write(profile_id, scope["method"], route_template(scope), data)
@@ -0,0 +1,78 @@
+"""
+Correlation IDs carried in context variables so every log record made while
+serving a request (or an agent job) can be tied back to it.
+
+``request_id`` is the HTTP request id in the API (taken from ``X-Request-ID``
+or generated) and the job id in the agent; ``interview_id`` is bound by code
+that works on one interview.
+"""
+
+import re
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+interview_id_var: ContextVar[Optional[str]] = ContextVar("interview_id", default=None)
+
+# Client-supplied ids are echoed into logs, so only accept short, plain tokens
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+
+def bind_request_id(request_id: Optional[str]) -> None:
+    request_id_var.set(request_id)
+
+
+def bind_interview_id(interview_id: Optional[str]) -> None:
+    interview_id_var.set(interview_id)
+
+
+async def bind_interview_from_path(request: Request) -> None:
+    """Router dependency binding the ``interview_id`` path parameter, if any.
+
+    Async on purpose: sync dependencies run in a worker thread, where the
+    binding would not reach the endpoint.
+    """
+    interview_id = request.path_params.get("interview_id")
+    if interview_id is not None:
+        bind_interview_id(interview_id)
+
+
+class RequestIdMiddleware:
+    """Pure ASGI middleware binding a request id for the duration of each
+    request and returning it in the ``X-Request-ID`` response header."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-request-id", request_id.encode())]
+            await send(message)
+
+        request_token = request_id_var.set(request_id)
+        interview_token = interview_id_var.set(None)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            interview_id_var.reset(interview_token)
+            request_id_var.reset(request_token)
@@ -0,0 +1,72 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class RevocationIndex:
+    """Process-local index of revoked, not-yet-expired token jtis.
+
+    Once loaded, membership checks never touch the database. Entries are
+    dropped when their ``expires_at`` passes, since an expired token is
+    rejected on its ``exp`` claim anyway.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.synced_at: Optional[datetime] = None
+
+    def add(self, jti: str, expires_at: Optional[datetime]) -> None:
+        with self._lock:
+            self._entries[jti] = _to_timestamp(expires_at)
+
+    def replace(self, entries: Iterable[Tuple[str, Optional[datetime]]], synced_at: datetime) -> None:
+        """Swap in a full snapshot of the blocklist"""
+        fresh = {jti: _to_timestamp(expires_at) for jti, expires_at in entries}
+        with self._lock:
+            self._entries = fresh
+            self.loaded = True
+            self.synced_at = synced_at
+
+    def merge(self, entries: Iterable[Tuple[str, Optional[datetime]]], synced_at: datetime) -> None:
+        """Add entries revoked since the last sync (possibly by other workers)"""
+        with self._lock:
+            for jti, expires_at in entries:
+                self._entries[jti] = _to_timestamp(expires_at)
+            self.synced_at = synced_at
+
+    def contains(self, jti: str) -> bool:
+        with self._lock:
+            expires_at = self._entries.get(jti)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._entries[jti]
+                return False
+            return True
+
+    def prune(self) -> int:
+        """Drop expired entries, returning how many were removed"""
+        now = time.time()
+        with self._lock:
+            expired = [jti for jti, expires_at in self._entries.items() if expires_at <= now]
+            for jti in expired:
+                del self._entries[jti]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _to_timestamp(expires_at: Optional[datetime]) -> float:
+    if expires_at is None:
+        return float("inf")
+    # SQLite hands back naive datetimes; they are stored in UTC
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp()
+
+
+revocation_index = RevocationIndex()
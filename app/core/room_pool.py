@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("app")
+
+# How long LiveKit keeps a room created for a single interview open while empty
+ROOM_EMPTY_TIMEOUT_SECONDS = 1800  # 30 minutes
+
+
+def generate_room_name() -> str:
+    """Server-side room name for a new interview"""
+    return f"interview-{uuid.uuid4().hex[:12]}"
+
+
+class RoomPool:
+    """Pre-created LiveKit rooms handed out to new interviews.
+
+    ``run()`` keeps ``target_size`` rooms ready and tops the pool up as soon as
+    claims take it to ``low_water``. Rooms are created with a long
+    ``empty_timeout`` and recycled (deleted and replaced) once older than
+    ``max_age_seconds``, so a claimed room always has time left before LiveKit
+    closes it. The pool is per process; each worker keeps its own.
+    """
+
+    def __init__(
+        self,
+        livekit_manager,
+        target_size: int,
+        low_water: int,
+        empty_timeout: int,
+        max_age_seconds: int,
+        refill_interval_seconds: float,
+        concurrency: int = 4,
+    ):
+        self.livekit_manager = livekit_manager
+        self.target_size = target_size
+        self.low_water = low_water
+        self.empty_timeout = empty_timeout
+        self.max_age_seconds = max_age_seconds
+        self.refill_interval_seconds = refill_interval_seconds
+        self._concurrency = concurrency
+        self._rooms: Deque[Tuple[str, float]] = deque()
+        self._expired: List[str] = []
+        self._refill_needed = asyncio.Event()
+        self.claims = 0
+        self.misses = 0
+        self.recycled = 0
+        self.create_failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.target_size > 0 and self.livekit_manager.is_configured
+
+    def claim(self) -> Optional[str]:
+        """Take a ready room name, or None if the pool is empty or disabled"""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        name = None
+        while self._rooms:
+            candidate, created_at = self._rooms.popleft()
+            if now - created_at < self.max_age_seconds:
+                name = candidate
+                break
+            self._expired.append(candidate)
+        if name is None:
+            self.misses += 1
+        else:
+            self.claims += 1
+        if len(self._rooms) <= self.low_water:
+            self._refill_needed.set()
+        return name
+
+    async def _create(self, semaphore: asyncio.Semaphore) -> None:
+        name = generate_room_name()
+        async with semaphore:
+            created = await self.livekit_manager.create_room(room_name=name, empty_timeout=self.empty_timeout)
+        if created:
+            self._rooms.append((name, time.monotonic()))
+        else:
+            self.create_failures += 1
+
+    async def _delete(self, names: List[str], semaphore: asyncio.Semaphore) -> None:
+        async def delete(name: str):
+            async with semaphore:
+                await self.livekit_manager.delete_room(name)
+        await asyncio.gather(*(delete(name) for name in names))
+
+    async def refill(self) -> int:
+        """Recycle aged rooms and create rooms up to ``target_size``. Returns rooms created."""
+        if not self.enabled:
+            return 0
+        now = time.monotonic()
+        while self._rooms and now - self._rooms[0][1] >= self.max_age_seconds:
+            self._expired.append(self._rooms.popleft()[0])
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+        if self._expired:
+            expired, self._expired = self._expired, []
+            self.recycled += len(expired)
+            await self._delete(expired, semaphore)
+
+        before = len(self._rooms)
+        missing = self.target_size - before
+        if missing > 0:
+            await asyncio.gather(*(self._create(semaphore) for _ in range(missing)))
+        return max(0, len(self._rooms) - before)
+
+    async def run(self) -> None:
+        """Keep the pool filled until cancelled"""
+        while True:
+            self._refill_needed.clear()
+            try:
+                await self.refill()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Room pool refill failed")
+            try:
+                await asyncio.wait_for(self._refill_needed.wait(), timeout=self.refill_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain(self) -> int:
+        """Delete every unclaimed room, e.g. on shutdown. Returns rooms deleted."""
+        names = [name for name, _ in self._rooms] + self._expired
+        self._rooms.clear()
+        self._expired = []
+        if names:
+            await self._delete(names, asyncio.Semaphore(self._concurrency))
+        return len(names)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "ready": len(self._rooms),
+            "target_size": self.target_size,
+            "claims": self.claims,
+            "misses": self.misses,
+            "recycled": self.recycled,
+            "create_failures": self.create_failures,
+        }
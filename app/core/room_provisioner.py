@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from app.core.request_context import bind_interview_id
+from app.crud.interviews import claim_stale_provisioning_interviews, finish_room_provisioning
+
+logger = logging.getLogger("app")
+
+
+class RoomProvisioner:
+    """Creates LiveKit rooms for interviews committed with status "provisioning".
+
+    ``submit()`` queues an interview and returns at once; ``run()`` works the
+    queue with ``concurrency`` workers, retrying each room up to
+    ``max_attempts`` times with jittered backoff before moving the interview
+    to "scheduled" or "room_creation_failed". The status only changes while
+    it is still "provisioning", so a room re-queued by ``recover()`` on another
+    worker, or a concurrent PUT, is never overwritten.
+    """
+
+    def __init__(
+        self,
+        livekit_manager,
+        session_factory,
+        empty_timeout: int,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        concurrency: int,
+        queue_size: int,
+        stale_seconds: float,
+        recovery_interval_seconds: float,
+    ):
+        self.livekit_manager = livekit_manager
+        self.session_factory = session_factory
+        self.empty_timeout = empty_timeout
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.concurrency = concurrency
+        self.stale_seconds = stale_seconds
+        self.recovery_interval_seconds = recovery_interval_seconds
+        self._queue: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue(maxsize=queue_size)
+        self._waiters: Dict[str, List] = {}
+        self.submitted = 0
+        self.provisioned = 0
+        self.failed = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def submit(self, interview_id: str, room_name: str) -> bool:
+        """Queue room creation for an interview; False if the queue is full"""
+        try:
+            self._queue.put_nowait((interview_id, room_name))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        self.submitted += 1
+        return True
+
+    async def recover(self) -> int:
+        """Claim and queue interviews left in "provisioning" for over
+        ``stale_seconds``, e.g. by a worker that restarted or died. Claims are
+        atomic, so with several workers each interview is queued by one.
+        Runs at startup and every ``recovery_interval_seconds`` (see
+        ``run``). Returns interviews queued."""
+        free = self._queue.maxsize - self._queue.qsize()
+        if free <= 0:
+            return 0
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=self.stale_seconds)
+        async with self.session_factory() as db:
+            claimed = await claim_stale_provisioning_interviews(db, stale_before, limit=free)
+        return sum(self.submit(interview_id, room_name) for interview_id, room_name in claimed)
+
+    async def _recover_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.recovery_interval_seconds)
+            try:
+                recovered = await self.recover()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Recovering stale room provisioning failed")
+                continue
+            if recovered:
+                logger.info(f"Resumed room provisioning for {recovered} interviews")
+
+    async def _create_room(self, room_name: str) -> bool:
+        for attempt in range(1, self.max_attempts + 1):
+            # Single attempt per call: this loop is the only retry layer, so a
+            # room costs at most max_attempts RPCs
+            if await self.livekit_manager.create_room(room_name=room_name, empty_timeout=self.empty_timeout, retry=False):
+                return True
+            if attempt < self.max_attempts:
+                self.retries += 1
+                backoff = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempt - 1))
+                await asyncio.sleep(random.uniform(0, backoff))
+        return False
+
+    async def provision(self, interview_id: str, room_name: str) -> str:
+        """Create the room and record the outcome. Returns the new status."""
+        created = await self._create_room(room_name)
+        new_status = "scheduled" if created else "room_creation_failed"
+        async with self.session_factory() as db:
+            await finish_room_provisioning(db, interview_id, new_status)
+        if created:
+            self.provisioned += 1
+        else:
+            self.failed += 1
+            logger.warning(f"Room {room_name} for interview {interview_id} could not be created")
+        self._notify(interview_id)
+        return new_status
+
+    async def _worker(self) -> None:
+        while True:
+            interview_id, room_name = await self._queue.get()
+            bind_interview_id(interview_id)
+            try:
+                await self.provision(interview_id, room_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"Provisioning room for interview {interview_id} failed")
+            finally:
+                self._queue.task_done()
+
+    async def run(self) -> None:
+        """Work the queue, and periodically recover stale interviews, until cancelled"""
+        await asyncio.gather(
+            self._recover_periodically(),
+            *(self._worker() for _ in range(self.concurrency)),
+        )
+
+    def _notify(self, interview_id: str) -> None:
+        waiter = self._waiters.get(interview_id)
+        if waiter:
+            waiter[0].set()
+
+    async def wait(self, interview_id: str, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for this worker to finish provisioning
+        the interview. Another worker may finish it instead, so callers re-read
+        the status after every wait."""
+        waiter = self._waiters.setdefault(interview_id, [asyncio.Event(), 0])
+        waiter[1] += 1
+        try:
+            await asyncio.wait_for(waiter[0].wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiter[1] -= 1
+            if not waiter[1]:
+                self._waiters.pop(interview_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "provisioned": self.provisioned,
+            "failed": self.failed,
+            "retries": self.retries,
+            "rejected": self.rejected,
+        }
+
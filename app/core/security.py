@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
 import uuid
 from passlib.context import CryptContext
 from jose import jwt, JWTError
@@ -8,9 +11,17 @@ import secrets
 import string
 
 from app.core.config import settings
+from app.core.metrics import PASSWORD_HASH_SECONDS
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event
+# loop while capping how many hashes run at once in this worker.
+_password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token with a unique jti claim""" 
     to_encode = data.copy()
@@ -41,11 +52,34 @@ def decode_access_token(token: str) -> Dict[str, Any]:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    with PASSWORD_HASH_SECONDS.labels("verify").time():
+        return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hash password"""
-    return pwd_context.hash(password)
+    with PASSWORD_HASH_SECONDS.labels("hash").time():
+        return pwd_context.hash(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash on the password hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash password on the password hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_hash_executor, get_password_hash, password)
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    return pwd_context.hash(secrets.token_urlsafe(16))
+
+async def verify_dummy_password_async(plain_password: str) -> bool:
+    """Spend one bcrypt verification so unknown users take as long as known ones"""
+    loop = asyncio.get_running_loop()
+    dummy_hash = await loop.run_in_executor(_password_hash_executor, _dummy_password_hash)
+    await verify_password_async(plain_password, dummy_hash)
+    return False
 
 def generate_api_key() -> str:
     """Generate secure API key"""
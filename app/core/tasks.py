@@ -0,0 +1,24 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger("app")
+
+
+async def run_periodic(interval_seconds: float, func: Callable[[], Awaitable[object]], name: str):
+    """Run ``func`` every ``interval_seconds`` until cancelled, logging failures"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await func()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Periodic task '{name}' failed")
+
+
+async def cancel_tasks(*tasks: asyncio.Task):
+    """Cancel background tasks and wait for them to finish"""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,46 @@
+from typing import Any, Dict, Hashable, Optional
+
+from app.core.ttl_cache import TTLLRUCache
+
+
+class ParticipantTokenCache:
+    """Bounded LRU of signed LiveKit participant tokens.
+
+    A cached token is handed out again until less than ``min_remaining_seconds``
+    of its lifetime is left, so clients that re-fetch on every reconnect get the
+    same JWT instead of a freshly signed one.
+    """
+
+    def __init__(self, max_entries: int, min_remaining_seconds: int):
+        self.min_remaining_seconds = min_remaining_seconds
+        self._cache: TTLLRUCache[Hashable, str] = TTLLRUCache(max_entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @staticmethod
+    def key(
+        room_name: str,
+        identity: str,
+        participant_name: str,
+        permissions: Optional[Dict[str, Any]],
+        revision: Optional[str],
+    ) -> Hashable:
+        return (room_name, identity, participant_name, tuple(sorted((permissions or {}).items())), revision)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        return self._cache.get(key, min_remaining=self.min_remaining_seconds)
+
+    def set(self, key: Hashable, token: str, expires_at: float) -> None:
+        self._cache.set(key, token, expires_at)
+
+    def invalidate_room(self, room_name: str) -> None:
+        """Drop every token issued for ``room_name``"""
+        self._cache.invalidate_where(lambda key, _: key[0] == room_name)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
@@ -0,0 +1,39 @@
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+
+# api_key_id -> (pending increment, most recent use)
+UsageBatch = Dict[str, Tuple[int, datetime]]
+
+
+class APIKeyUsageBuffer:
+    """In-memory accumulator for API key usage, flushed to the database in batches"""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._pending: UsageBatch = {}
+        self._lock = threading.Lock()
+
+    def record(self, api_key_id: str) -> bool:
+        """Count one use of a key. Returns True once the buffer is full and should be flushed."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            count, _ = self._pending.get(api_key_id, (0, now))
+            self._pending[api_key_id] = (count + 1, now)
+            return len(self._pending) >= self.max_keys
+
+    def drain(self) -> UsageBatch:
+        """Take every pending increment, leaving the buffer empty"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, batch: UsageBatch) -> None:
+        """Put back a batch that failed to flush so the counts are not lost"""
+        with self._lock:
+            for api_key_id, (count, last_used_at) in batch.items():
+                pending_count, pending_last_used = self._pending.get(api_key_id, (0, last_used_at))
+                self._pending[api_key_id] = (pending_count + count, max(pending_last_used, last_used_at))
+
+    def __len__(self) -> int:
+        return len(self._pending)
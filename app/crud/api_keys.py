@@ -1,45 +1,92 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from datetime import datetime, timezone
 from app.db import models
 from app.schemas import api_key as api_key_schemas
 from app.core.security import generate_api_key, generate_api_secret
+from app.core.config import settings
+from app.core.usage_buffer import APIKeyUsageBuffer, UsageBatch
 
+api_key_usage_buffer = APIKeyUsageBuffer(max_keys=settings.API_KEY_USAGE_MAX_BUFFERED_KEYS)
 
-def create_api_key(db: Session, api_key: api_key_schemas.APIKeyCreate, user_id: str) -> models.APIKey:
+
+async def create_api_key(db: AsyncSession, api_key: api_key_schemas.APIKeyCreate, user_id: str) -> models.APIKey:
     key = generate_api_key()
     secret = generate_api_secret()
     db_api_key = models.APIKey(name=api_key.name, key=key, secret=secret, owner_id=user_id)
     db.add(db_api_key)
-    db.commit()
-    db.refresh(db_api_key)
+    await db.commit()
+    await db.refresh(db_api_key)
     return db_api_key
 
 
-def get_user_api_keys(db: Session, user_id: str) -> List[models.APIKey]:
-    return db.query(models.APIKey).filter(models.APIKey.owner_id == user_id).all()
+async def get_user_api_keys(db: AsyncSession, user_id: str) -> List[models.APIKey]:
+    result = await db.execute(select(models.APIKey).where(models.APIKey.owner_id == user_id))
+    return list(result.scalars().all())
 
 
-def get_api_key(db: Session, key: str) -> Optional[models.APIKey]:
-    return db.query(models.APIKey).filter(models.APIKey.key == key).first()
+async def get_api_key(db: AsyncSession, key: str) -> Optional[models.APIKey]:
+    """Get API key by its value, with the owning user loaded"""
+    result = await db.execute(
+        select(models.APIKey)
+        .options(joinedload(models.APIKey.owner))
+        .where(models.APIKey.key == key)
+    )
+    return result.scalars().first()
 
 
-def update_api_key_usage(db: Session, api_key_id: str):
-    db_api_key = db.query(models.APIKey).filter(models.APIKey.id == api_key_id).first()
+async def update_api_key_usage(db: AsyncSession, api_key_id: str):
+    result = await db.execute(select(models.APIKey).where(models.APIKey.id == api_key_id))
+    db_api_key = result.scalars().first()
     if db_api_key:
         db_api_key.usage_count += 1
         db_api_key.last_used_at = datetime.now(timezone.utc)
-        db.commit()
+        await db.commit()
+
+
+async def record_api_key_usage(db: AsyncSession, api_key_id: str):
+    """Buffer one use of an API key; the write happens in flush_api_key_usage.
+
+    If the buffer holds too many distinct keys it is flushed immediately so
+    memory stays bounded between periodic flushes.
+    """
+    if api_key_usage_buffer.record(api_key_id):
+        await flush_api_key_usage(db)
+
+
+async def flush_api_key_usage(db: AsyncSession) -> int:
+    """Write buffered usage as one relative UPDATE per key in a single transaction"""
+    batch: UsageBatch = api_key_usage_buffer.drain()
+    if not batch:
+        return 0
+    try:
+        for api_key_id, (count, last_used_at) in batch.items():
+            await db.execute(
+                update(models.APIKey)
+                .where(models.APIKey.id == api_key_id)
+                .values(
+                    usage_count=func.coalesce(models.APIKey.usage_count, 0) + count,
+                    last_used_at=last_used_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        api_key_usage_buffer.restore(batch)
+        raise
+    return len(batch)
 
 
-def deactivate_api_key(db: Session, key_id: str, user_id: str) -> bool:
-    db_api_key = (
-        db.query(models.APIKey)
-        .filter(models.APIKey.id == key_id, models.APIKey.owner_id == user_id)
-        .first()
+async def deactivate_api_key(db: AsyncSession, key_id: str, user_id: str) -> bool:
+    result = await db.execute(
+        select(models.APIKey).where(models.APIKey.id == key_id, models.APIKey.owner_id == user_id)
     )
+    db_api_key = result.scalars().first()
     if db_api_key:
         db_api_key.is_active = False
-        db.commit()
+        await db.commit()
         return True
     return False
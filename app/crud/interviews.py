@@ -1,48 +1,332 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional, List, Sequence, Tuple
+from sqlalchemy import Row, and_, func, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, undefer_group
+from app.core.room_pool import generate_room_name
 from app.db import models
 from app.schemas import interview as interview_schemas
 
 
-def create_interview(db: Session, interview: interview_schemas.InterviewCreate, user_id: str) -> models.Interview:
-    """Create new interview with server-generated room_name."""
-    generated_room_name = f"interview-{uuid.uuid4().hex[:12]}"
+# Status of an interview whose room is still being created in the background
+PROVISIONING_STATUS = "provisioning"
+# Statuses written by the agent: while it runs, after complete_interview, and
+# when the session ended (disconnect) without completing
+IN_PROGRESS_STATUS = "in_progress"
+COMPLETED_STATUS = "completed"
+INCOMPLETE_STATUS = "incomplete"
+
+
+async def create_interview(
+    db: AsyncSession,
+    interview: interview_schemas.InterviewCreate,
+    user_id: str,
+    room_name: Optional[str] = None,
+    status: str = "scheduled",
+) -> models.Interview:
+    """Create new interview, using a pre-provisioned room_name when given or generating one."""
     db_interview = models.Interview(
         **interview.model_dump(),
-        room_name=generated_room_name,
+        room_name=room_name or generate_room_name(),
         creator_id=user_id,
+        status=status,
     )
     db.add(db_interview)
-    db.commit()
-    db.refresh(db_interview)
+    await db.commit()
+    await db.refresh(db_interview)
     return db_interview
 
- 
 
-def get_user_interviews(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[models.Interview]:
-    return (
-        db.query(models.Interview)
-        .filter(models.Interview.creator_id == user_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+
+async def create_interviews(
+    db: AsyncSession,
+    interviews: Sequence[interview_schemas.InterviewCreate],
+    user_id: str,
+    room_names: Sequence[Optional[str]],
+) -> List[models.Interview]:
+    """Create many interviews in one transaction, in input order.
+
+    ``room_names`` holds a pre-provisioned room name (or None) per interview.
+    """
+    db_interviews = [
+        models.Interview(
+            **interview.model_dump(),
+            room_name=room_name or generate_room_name(),
+            creator_id=user_id,
+        )
+        for interview, room_name in zip(interviews, room_names)
+    ]
+    db.add_all(db_interviews)
+    await db.commit()
+    # One query to load server-side defaults (created_at) for the whole batch
+    ids = [db_interview.id for db_interview in db_interviews]
+    result = await db.execute(
+        select(models.Interview)
+        .where(models.Interview.id.in_(ids))
+        .execution_options(populate_existing=True)
+    )
+    result.scalars().all()
+    return db_interviews
+
+
+async def set_interviews_status(db: AsyncSession, interview_ids: Sequence[str], status: str) -> None:
+    """Set ``status`` on many interviews with a single UPDATE"""
+    if not interview_ids:
+        return
+    await db.execute(
+        update(models.Interview)
+        .where(models.Interview.id.in_(interview_ids))
+        .values(status=status)
+    )
+    await db.commit()
+
+
+async def finish_room_provisioning(db: AsyncSession, interview_id: str, status: str) -> bool:
+    """Move an interview out of "provisioning". Returns False if it had already left it."""
+    Interview = models.Interview
+    result = await db.execute(
+        update(Interview)
+        .where(Interview.id == interview_id, Interview.status == PROVISIONING_STATUS)
+        .values(status=status)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def save_interview_progress(
+    db: AsyncSession,
+    room_name: str,
+    interview_data: dict,
+    technical_score: int,
+    behavioral_score: int,
+    status: str,
+    started_at: datetime,
+    completed_at: Optional[datetime] = None,
+    overall_feedback: Optional[str] = None,
+    final: bool = False,
+) -> bool:
+    """Checkpoint agent results onto the interview held in ``room_name`` with a
+    single UPDATE (bumping updated_at). ``started_at`` is only set once.
+
+    Only the ``final`` write of a session may update an interview that is
+    already completed or incomplete, so a late periodic checkpoint never
+    reverts the final status. Returns False if no row was updated.
+    """
+    Interview = models.Interview
+    values = dict(
+        interview_data=interview_data,
+        technical_score=technical_score,
+        behavioral_score=behavioral_score,
+        status=status,
+        started_at=func.coalesce(Interview.started_at, started_at),
+    )
+    if completed_at is not None:
+        values["completed_at"] = completed_at
+    if overall_feedback is not None:
+        values["overall_feedback"] = overall_feedback
+    statement = update(Interview).where(Interview.room_name == room_name)
+    if not final:
+        statement = statement.where(Interview.status.notin_((COMPLETED_STATUS, INCOMPLETE_STATUS)))
+    result = await db.execute(
+        statement.values(**values).execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def get_interview_config_by_room(db: AsyncSession, room_name: str) -> Optional[Row]:
+    """(id, candidate_name, position, interview_config) of the interview held in ``room_name``"""
+    Interview = models.Interview
+    result = await db.execute(
+        select(Interview.id, Interview.candidate_name, Interview.position, Interview.interview_config)
+        .where(Interview.room_name == room_name)
+    )
+    return result.first()
+
+
+async def claim_stale_provisioning_interviews(
+    db: AsyncSession, stale_before: datetime, limit: int
+) -> List[Tuple[str, str]]:
+    """Claim up to ``limit`` interviews left in "provisioning" and untouched
+    since ``stale_before``; returns their (id, room_name).
+
+    The claim stamps updated_at in the same UPDATE that selects the rows, so
+    workers recovering concurrently never claim the same interview: the
+    staleness check is re-evaluated on the row being updated.
+    """
+    Interview = models.Interview
+    stale = and_(
+        Interview.status == PROVISIONING_STATUS,
+        or_(
+            Interview.updated_at < stale_before,
+            and_(Interview.updated_at.is_(None), Interview.created_at < stale_before),
+        ),
+    )
+    candidates = select(Interview.id).where(stale).order_by(Interview.created_at).limit(limit)
+    result = await db.execute(
+        update(Interview)
+        .where(Interview.id.in_(candidates), stale)
+        .values(updated_at=datetime.now(timezone.utc))
+        .returning(Interview.id, Interview.room_name)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = [tuple(row) for row in result.all()]
+    await db.commit()
+    return claimed
+
+
+async def get_interview_status(db: AsyncSession, interview_id: str) -> Optional[Row]:
+    """(creator_id, status) of an interview, without loading it"""
+    Interview = models.Interview
+    result = await db.execute(
+        select(Interview.creator_id, Interview.status).where(Interview.id == interview_id)
     )
+    return result.first()
 
 
-def get_interview(db: Session, interview_id: str) -> Optional[models.Interview]:
-    return db.query(models.Interview).filter(models.Interview.id == interview_id).first()
+def _summary_columns():
+    return [getattr(models.Interview, field) for field in interview_schemas.InterviewSummary.model_fields]
 
 
-def update_interview(
-    db: Session, interview_id: str, interview_update: interview_schemas.InterviewUpdate
+def _user_interviews_page(query, user_id: str, skip: int, limit: int, after: Optional[Tuple[datetime, str]]):
+    Interview = models.Interview
+    query = query.where(Interview.creator_id == user_id)
+    if after is not None:
+        # Row-value comparison lets the index seek on both columns at once
+        query = query.where(
+            tuple_(Interview.created_at, Interview.id)
+            < tuple_(*after, types=[Interview.created_at.type, Interview.id.type])
+        )
+    query = query.order_by(Interview.created_at.desc(), Interview.id.desc())
+    if skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+async def get_user_interviews(
+    db: AsyncSession,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[datetime, str]] = None,
+    full: bool = False,
+) -> List[models.Interview]:
+    """List a user's interviews newest first, ordered by (created_at, id).
+
+    ``after`` is the (created_at, id) of the last row of the previous page and
+    seeks straight to the next one through ix_interviews_creator_created_id;
+    ``skip`` is the legacy OFFSET mode. Only the InterviewSummary columns are
+    loaded unless ``full`` is set.
+    """
+    query = select(models.Interview).options(
+        undefer_group("payload") if full else load_only(*_summary_columns(), models.Interview.updated_at)
+    )
+    result = await db.execute(_user_interviews_page(query, user_id, skip, limit, after))
+    return list(result.scalars().all())
+
+
+async def get_user_interview_versions(
+    db: AsyncSession,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[datetime, str]] = None,
+) -> Sequence[Row]:
+    """(id, created_at, updated_at) of the page get_user_interviews would
+    return, for revalidating a cached page without loading the interviews."""
+    Interview = models.Interview
+    query = select(Interview.id, Interview.created_at, Interview.updated_at)
+    result = await db.execute(_user_interviews_page(query, user_id, skip, limit, after))
+    return result.all()
+
+
+async def get_interview(db: AsyncSession, interview_id: str, full: bool = False) -> Optional[models.Interview]:
+    """Load an interview; the JSON payload columns only when ``full`` is set"""
+    query = select(models.Interview).where(models.Interview.id == interview_id)
+    if full:
+        query = query.options(undefer_group("payload"))
+    result = await db.execute(query)
+    return result.scalars().first()
+
+
+async def load_interview_payload(db: AsyncSession, db_interview: models.Interview) -> None:
+    """Load the deferred payload columns of an interview loaded without them"""
+    await db.refresh(db_interview, attribute_names=["interview_config", "interview_data", "updated_at"])
+
+
+async def update_interview(
+    db: AsyncSession, interview_id: str, interview_update: interview_schemas.InterviewUpdate
 ) -> Optional[models.Interview]:
-    db_interview = db.query(models.Interview).filter(models.Interview.id == interview_id).first()
+    db_interview = await get_interview(db, interview_id)
     if not db_interview:
         return None
     update_data = interview_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_interview, field, value)
-    db.commit()
-    db.refresh(db_interview)
+    await db.commit()
+    await db.refresh(db_interview)
     return db_interview
+
+
+async def update_interview_if_unmodified(
+    db: AsyncSession, db_interview: models.Interview, interview_update: interview_schemas.InterviewUpdate
+) -> Optional[models.Interview]:
+    """Apply the update only if the row still has the updated_at it was
+    loaded with. Returns None if another writer changed it in between."""
+    update_data = interview_update.model_dump(exclude_unset=True)
+    if not update_data:
+        return db_interview
+    Interview = models.Interview
+    loaded_version = db_interview.updated_at
+    unchanged = Interview.updated_at.is_(None) if loaded_version is None else Interview.updated_at == loaded_version
+    result = await db.execute(
+        update(Interview)
+        .where(Interview.id == db_interview.id, unchanged)
+        .values(**update_data)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount != 1:
+        return None
+    await db.refresh(db_interview)
+    return db_interview
+
+
+# Columns included in interview exports, in output order
+EXPORT_COLUMNS = (
+    "id", "title", "candidate_name", "candidate_email", "position", "status",
+    "room_name", "technical_score", "behavioral_score", "overall_feedback",
+    "interview_config", "interview_data", "scheduled_at", "started_at",
+    "completed_at", "created_at", "updated_at", "creator_id",
+)
+
+
+async def stream_interviews_for_export(
+    db: AsyncSession,
+    creator_id: Optional[str] = None,
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    batch_size: int = 500,
+) -> AsyncIterator[Sequence[Row]]:
+    """Yield batches of export rows (plain column tuples, no ORM objects)
+    from a server-side cursor, ordered by (created_at, id).
+
+    ``creator_id=None`` exports every user's interviews.
+    """
+    Interview = models.Interview
+    query = select(*(getattr(Interview, column) for column in EXPORT_COLUMNS))
+    if creator_id is not None:
+        query = query.where(Interview.creator_id == creator_id)
+    if status is not None:
+        query = query.where(Interview.status == status)
+    if created_from is not None:
+        query = query.where(Interview.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(Interview.created_at < created_to)
+    query = query.order_by(Interview.created_at, Interview.id).execution_options(yield_per=batch_size)
+
+    result = await db.stream(query)
+    async for batch in result.partitions():
+        yield batch
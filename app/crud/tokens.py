@@ -1,28 +1,61 @@
 from typing import Optional
-from sqlalchemy.orm import Session
-from datetime import datetime, timezone
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
 from app.db import models
+from app.core.revocation import revocation_index
 
+# Re-read rows created shortly before the last sync to cover clock skew and
+# transactions that committed after their created_at was stamped.
+_SYNC_OVERLAP = timedelta(seconds=60)
 
-def add_token_to_blocklist(db: Session, jti: str, expires_at: datetime):
+
+async def add_token_to_blocklist(db: AsyncSession, jti: str, expires_at: datetime):
     token = models.TokenBlocklist(jti=jti, expires_at=expires_at)
     db.add(token)
-    db.commit()
-    db.refresh(token)
+    await db.commit()
+    await db.refresh(token)
+    revocation_index.add(jti, expires_at)
     return token
 
 
-def is_token_blocklisted(db: Session, jti: str) -> bool:
-    token = db.query(models.TokenBlocklist).filter(models.TokenBlocklist.jti == jti).first()
-    return token is not None
+async def is_token_blocklisted(db: AsyncSession, jti: str) -> bool:
+    if revocation_index.loaded:
+        return revocation_index.contains(jti)
+    result = await db.execute(
+        select(models.TokenBlocklist.id).where(models.TokenBlocklist.jti == jti).limit(1)
+    )
+    return result.first() is not None
+
+
+async def sync_revocation_index(db: AsyncSession) -> int:
+    """Load unexpired blocklist entries into the in-memory revocation index.
+
+    The first call loads a full snapshot; later calls only fetch rows created
+    since the previous sync, which picks up logouts handled by other workers.
+    """
+    now = datetime.now(timezone.utc)
+    query = select(models.TokenBlocklist.jti, models.TokenBlocklist.expires_at).where(
+        (models.TokenBlocklist.expires_at.is_(None)) | (models.TokenBlocklist.expires_at > now)
+    )
+    if not revocation_index.loaded:
+        rows = (await db.execute(query)).all()
+        revocation_index.replace(rows, synced_at=now)
+    else:
+        since = revocation_index.synced_at - _SYNC_OVERLAP
+        rows = (await db.execute(query.where(models.TokenBlocklist.created_at >= since))).all()
+        revocation_index.merge(rows, synced_at=now)
+        revocation_index.prune()
+    return len(rows)
 
 
-def cleanup_expired_blocklisted_tokens(db: Session) -> int:
+async def cleanup_expired_blocklisted_tokens(db: AsyncSession) -> int:
     now = datetime.now(timezone.utc)
-    deleted_count = (
-        db.query(models.TokenBlocklist)
-        .filter(models.TokenBlocklist.expires_at.isnot(None), models.TokenBlocklist.expires_at < now)
-        .delete(synchronize_session=False)
+    result = await db.execute(
+        delete(models.TokenBlocklist)
+        .where(models.TokenBlocklist.expires_at.isnot(None), models.TokenBlocklist.expires_at < now)
+        .execution_options(synchronize_session=False)
     )
-    db.commit()
-    return int(deleted_count or 0)
+    await db.commit()
+    revocation_index.prune()
+    return int(result.rowcount or 0)
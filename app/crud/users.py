@@ -1,23 +1,29 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import models
 from app.schemas import user as user_schemas
-from app.core.security import get_password_hash, verify_password
+from app.core.config import settings
+from app.core.security import get_password_hash_async, verify_password_async, verify_dummy_password_async
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[models.User]:
     """Get user by email"""
-    return db.query(models.User).filter(models.User.email == email).first()
+    result = await db.execute(select(models.User).where(models.User.email == email))
+    return result.scalars().first()
 
 
-def get_user_by_username(db: Session, username: str) -> Optional[models.User]:
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[models.User]:
     """Get user by username"""
-    return db.query(models.User).filter(models.User.username == username).first()
+    result = await db.execute(select(models.User).where(models.User.username == username))
+    return result.scalars().first()
 
 
-def create_user(db: Session, user: user_schemas.UserCreate) -> models.User:
+async def create_user(db: AsyncSession, user: user_schemas.UserCreate) -> models.User:
     """Create new user"""
-    hashed_password = get_password_hash(user.password)
+    # Release the pooled connection held by earlier reads while bcrypt runs
+    await db.rollback()
+    hashed_password = await get_password_hash_async(user.password)
     db_user = models.User(
         email=user.email,
         username=user.username,
@@ -25,16 +31,21 @@ def create_user(db: Session, user: user_schemas.UserCreate) -> models.User:
         hashed_password=hashed_password,
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[models.User]:
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[models.User]:
     """Authenticate user"""
-    user = get_user_by_email(db, email=email)
+    user = await get_user_by_email(db, email=email)
     if not user:
+        if settings.LOGIN_CONSTANT_TIME_REJECT:
+            await verify_dummy_password_async(password)
         return None
-    if not verify_password(password, user.hashed_password):
+    # Detach the loaded user and release the pooled connection while bcrypt runs
+    db.expunge(user)
+    await db.rollback()
+    if not await verify_password_async(password, user.hashed_password):
         return None
     return user
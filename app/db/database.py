@@ -1,20 +1,53 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.engine_profiles import engine_options, install_profile_hooks
+from app.core.metrics import install_db_metrics
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+# Async driver used for each backend named in DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Rewrite a sync DATABASE_URL (e.g. sqlite://, postgresql://) to its async driver"""
+    url = make_url(database_url)
+    backend = "postgresql" if url.get_backend_name() == "postgres" else url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or url.get_driver_name() == driver:
+        return url.render_as_string(hide_password=False)
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+# Sync engine for tooling (schema creation, migrations, scripts)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL, is_async=False))
+install_profile_hooks(engine, settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine used by the API
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    **engine_options(settings.DATABASE_URL, is_async=True),
+)
+install_profile_hooks(async_engine.sync_engine, settings.DATABASE_URL)
+if settings.METRICS_ENABLED:
+    install_db_metrics(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
-def get_db():
+async def get_db():
     """Database dependency"""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,173 @@
+"""
+Named engine profiles selected by ``DB_ENGINE_PROFILE``.
+
+- ``sqlite``: WAL journal, ``synchronous=NORMAL``, mmap and busy_timeout pragmas
+  applied on every new connection so concurrent writers wait instead of failing.
+- ``postgres``: sized pool with pre-ping, recycling and asyncpg statement caching.
+- ``default``: SQLAlchemy defaults, as before profiles existed.
+- ``auto`` (default): ``sqlite`` or ``postgres`` depending on ``DATABASE_URL``.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+PROFILES = ("auto", "default", "sqlite", "postgres")
+
+
+class PoolMetrics:
+    """Counts pool checkouts and how long callers waited for a connection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def observe(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class _TimedCheckoutMixin:
+    """Records the time spent obtaining a connection from the pool"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_metrics.observe(time.perf_counter() - start)
+
+
+# SQLAlchemy names a pool's logger after its class's module; keep these under
+# sqlalchemy.pool like the pools they extend, so pool lifecycle messages stay
+# out of the app.* loggers
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.QueuePool"
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+
+# In case a SQLAlchemy release stops honouring the namespace above
+logging.getLogger(__name__).setLevel(logging.WARNING)
+
+
+def resolve_profile(database_url: str) -> str:
+    profile = settings.DB_ENGINE_PROFILE.lower()
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown DB_ENGINE_PROFILE '{settings.DB_ENGINE_PROFILE}', expected one of {PROFILES}")
+    if profile != "auto":
+        return profile
+    backend = make_url(database_url).get_backend_name()
+    return "sqlite" if backend == "sqlite" else "postgres"
+
+
+def _is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(database_url: str, is_async: bool) -> Dict[str, Any]:
+    """Keyword arguments for create_engine / create_async_engine under the active profile"""
+    profile = resolve_profile(database_url)
+    backend = make_url(database_url).get_backend_name()
+    options: Dict[str, Any] = {}
+
+    if backend == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+
+    if profile == "default" or _is_memory_sqlite(database_url):
+        return options
+
+    options["poolclass"] = TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool
+    options["pool_size"] = settings.DB_POOL_SIZE
+    options["max_overflow"] = settings.DB_MAX_OVERFLOW
+    options["pool_timeout"] = settings.DB_POOL_TIMEOUT_SECONDS
+    options["query_cache_size"] = settings.DB_QUERY_CACHE_SIZE
+
+    if profile == "postgres":
+        options["pool_pre_ping"] = True
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE_SECONDS
+        if is_async and backend == "postgresql":
+            options["connect_args"] = {
+                "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            }
+    return options
+
+
+def install_profile_hooks(engine: Engine, database_url: str) -> None:
+    """Attach per-connection setup (SQLite pragmas) for the active profile.
+
+    For async engines pass ``async_engine.sync_engine``.
+    """
+    if resolve_profile(database_url) != "sqlite" or make_url(database_url).get_backend_name() != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if not _is_memory_sqlite(database_url):
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        finally:
+            cursor.close()
+
+
+def describe_engine(engine: Engine, database_url: str) -> Dict[str, Any]:
+    """Effective pool configuration, for startup logging and health output"""
+    pool = engine.pool
+    description: Dict[str, Any] = {
+        "profile": resolve_profile(database_url),
+        "backend": make_url(database_url).get_backend_name(),
+        "pool_class": type(pool).__name__,
+    }
+    if isinstance(pool, QueuePool):
+        description.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "pool_timeout": pool.timeout(),
+            "pool_recycle": pool._recycle,
+            "pool_pre_ping": pool._pre_ping,
+        })
+    return description
+
+
+def pool_usage(engine: Engine) -> Dict[str, Any]:
+    """Connections in use against pool capacity; saturation is None for unbounded pools"""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"checked_out": None, "capacity": None, "saturation": None}
+    checked_out = pool.checkedout()
+    capacity = pool.size() + pool._max_overflow if pool._max_overflow >= 0 else None
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else None,
+    }
@@ -1,12 +1,28 @@
 import uuid
+from datetime import datetime, timezone
 from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql import func
 from app.db.database import Base
 
+# SQLite fills created_at from CURRENT_TIMESTAMP ("YYYY-MM-DD HH:MM:SS") and
+# compares it as text, so bound values must use the same format for keyset
+# pagination comparisons to be correct
+CreatedAtType = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
+
 class CreatedAtMixin:
     """Mixin providing a timezone-aware created_at column."""
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(CreatedAtType, server_default=func.now())
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 class UpdatedAtMixin:
     """Mixin providing a timezone-aware updated_at column."""
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Stamped in Python rather than with the database's now(): SQLite's
+    # CURRENT_TIMESTAMP has one-second resolution, and updated_at versions
+    # ETags, so two updates within a second must still differ
+    updated_at = Column(DateTime(timezone=True), onupdate=_utcnow)
@@ -1,12 +1,16 @@
 import uuid
-from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy.orm import deferred, relationship
 from app.db.database import Base
 from .base import CreatedAtMixin, UpdatedAtMixin
 
 class Interview(Base, CreatedAtMixin, UpdatedAtMixin):
     """Interview session model"""
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Serves per-creator listings ordered by (created_at, id) without a sort
+        Index("ix_interviews_creator_created_id", "creator_id", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     title = Column(String, nullable=False)
@@ -17,14 +21,16 @@ class Interview(Base, CreatedAtMixin, UpdatedAtMixin):
     room_name = Column(String, unique=True, nullable=False)
     interview_token = Column(String)
 
-    # Interview configuration
-    interview_config = Column(JSON)
+    # Interview configuration. The JSON payload columns can grow large, so they
+    # are only loaded on request (undefer_group("payload")); touching them
+    # unloaded raises instead of issuing a lazy load
+    interview_config = deferred(Column(JSON), group="payload", raiseload=True)
 
     # Results
     technical_score = Column(Integer, default=0)
     behavioral_score = Column(Integer, default=0)
     overall_feedback = Column(Text)
-    interview_data = Column(JSON)
+    interview_data = deferred(Column(JSON), group="payload", raiseload=True)
 
     # Timestamps
     scheduled_at = Column(DateTime(timezone=True))
@@ -1,36 +1,124 @@
-from fastapi import FastAPI, Depends, HTTPException, status
-from scalar_fastapi import get_scalar_api_reference
+from fastapi import FastAPI, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from contextlib import asynccontextmanager
+import asyncio
 import logging
-from app.core.logging_config import setup_logging
+from app.core.logging_config import logging_stats, setup_logging
 import uvicorn
 
 # Import all modules
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password, create_access_token, decode_access_token
-from app.db.database import engine, get_db
+from app.db.database import async_engine, get_db, AsyncSessionLocal
+from app.db.engine_profiles import describe_engine, pool_metrics
 from app.db.models import Base as ModelsBase
 # Note: prefer importing specific CRUD modules in routes; facade remains for compatibility if needed
 from app.api.api import api_router
 from app.core.livekit_manager import LiveKitManager
+from app.core.health import ReadinessProbe
+from app.core.metrics import PrometheusMiddleware, mark_worker_dead, render_metrics
+from app.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware
+from app.core.request_context import REQUEST_ID_HEADER, RequestIdMiddleware
+from app.api.deps import is_superuser_token
+from app.core.room_pool import ROOM_EMPTY_TIMEOUT_SECONDS, RoomPool
+from app.core.room_provisioner import RoomProvisioner
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.tasks import run_periodic, cancel_tasks
+from app.crud.tokens import sync_revocation_index
+from app.crud.api_keys import flush_api_key_usage
 
-setup_logging()
 logger = logging.getLogger("app")
 
-ModelsBase.metadata.create_all(bind=engine)
+# Importing this module has no side effects (no logging setup, no database
+# access): workers only connect once the lifespan starts, and the schema is
+# managed by Alembic (`alembic upgrade head`) outside the request workers
+
+async def _create_tables() -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(ModelsBase.metadata.create_all)
+
+async def _sync_revocation_index() -> int:
+    async with AsyncSessionLocal() as db:
+        return await sync_revocation_index(db)
+
+async def _flush_api_key_usage() -> int:
+    async with AsyncSessionLocal() as db:
+        return await flush_api_key_usage(db)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
+    setup_logging()
     logger.info("Starting ")
+    if settings.DB_CREATE_TABLES_ON_STARTUP:
+        await _create_tables()
     
     app.state.livekit_manager = LiveKitManager()
+    await app.state.livekit_manager.start()
+    app.state.room_pool = RoomPool(
+        app.state.livekit_manager,
+        target_size=settings.ROOM_POOL_TARGET_SIZE,
+        low_water=settings.ROOM_POOL_LOW_WATER,
+        empty_timeout=settings.ROOM_POOL_EMPTY_TIMEOUT_SECONDS,
+        max_age_seconds=settings.ROOM_POOL_MAX_AGE_SECONDS,
+        refill_interval_seconds=settings.ROOM_POOL_REFILL_SECONDS,
+    )
+    app.state.room_provisioner = RoomProvisioner(
+        app.state.livekit_manager,
+        AsyncSessionLocal,
+        empty_timeout=ROOM_EMPTY_TIMEOUT_SECONDS,
+        max_attempts=settings.ROOM_PROVISIONING_MAX_ATTEMPTS,
+        retry_base_seconds=settings.ROOM_PROVISIONING_RETRY_BASE_SECONDS,
+        retry_max_seconds=settings.ROOM_PROVISIONING_RETRY_MAX_SECONDS,
+        concurrency=settings.ROOM_PROVISIONING_CONCURRENCY,
+        queue_size=settings.ROOM_PROVISIONING_QUEUE_SIZE,
+        stale_seconds=settings.ROOM_PROVISIONING_STALE_SECONDS,
+        recovery_interval_seconds=settings.ROOM_PROVISIONING_RECOVERY_SECONDS,
+    )
+    app.state.readiness = ReadinessProbe(
+        async_engine,
+        app.state.livekit_manager,
+        cache_seconds=settings.HEALTH_PROBE_CACHE_SECONDS,
+        timeout_seconds=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+        saturation_threshold=settings.HEALTH_POOL_SATURATION_THRESHOLD,
+    )
+    logger.info(f"Database engine: {describe_engine(async_engine.sync_engine, settings.DATABASE_URL)}")
+
+    revoked = await _sync_revocation_index()
+    logger.info(f"Loaded {revoked} revoked tokens into the revocation index")
+    background_tasks = [
+        asyncio.create_task(run_periodic(
+            settings.TOKEN_REVOCATION_SYNC_SECONDS,
+            _sync_revocation_index,
+            name="revocation-sync",
+        )),
+        asyncio.create_task(run_periodic(
+            settings.API_KEY_USAGE_FLUSH_SECONDS,
+            _flush_api_key_usage,
+            name="api-key-usage-flush",
+        )),
+    ]
+    if app.state.room_pool.enabled:
+        background_tasks.append(asyncio.create_task(app.state.room_pool.run()))
+    recovered = await app.state.room_provisioner.recover()
+    if recovered:
+        logger.info(f"Resumed room provisioning for {recovered} interviews")
+    background_tasks.append(asyncio.create_task(app.state.room_provisioner.run()))
     
     yield
     
     logger.info("Shutting down")
+    await cancel_tasks(*background_tasks)
+    flushed = await _flush_api_key_usage()
+    logger.info(f"Flushed usage for {flushed} API keys")
+    logger.info(f"Database pool checkouts: {pool_metrics.snapshot()}")
+    drained = await app.state.room_pool.drain()
+    logger.info(f"Deleted {drained} unclaimed pooled rooms")
+    await app.state.livekit_manager.aclose()
+    await async_engine.dispose()
+    mark_worker_dead()
 
 app = FastAPI(
     title="AI Interview Platform",
@@ -52,12 +140,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", PROFILE_ID_HEADER, REQUEST_ID_HEADER],
 )
 
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        authorize=is_superuser_token,
+        sample_rate=settings.PROFILE_SAMPLE_RATE,
+        interval=settings.PROFILE_INTERVAL_SECONDS,
+    )
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(PrometheusMiddleware)
+
+# Outermost, so logs from every other layer carry the request id
+app.add_middleware(RequestIdMiddleware)
+
 app.include_router(api_router, prefix="/api")
 
 @app.get("/scalar", include_in_schema=False)
 async def scalar_html():
+    from scalar_fastapi import get_scalar_api_reference
+
     return get_scalar_api_reference(
         openapi_url=app.openapi_url,
         title=app.title,
@@ -72,13 +177,57 @@ async def root():
         "status": "healthy"
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics (all workers when PROMETHEUS_MULTIPROC_DIR is set)"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the worker is up and its event loop responds. Checks no dependencies."""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness(request: Request):
+    """Readiness probe: 200 while the database answers and its pool has headroom, else 503"""
+    probe = getattr(request.app.state, "readiness", None)
+    if probe is None:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "starting"})
+    state, report = await probe.check()
+    code = status.HTTP_503_SERVICE_UNAVAILABLE if state == "not_ready" else status.HTTP_200_OK
+    return JSONResponse(status_code=code, content=report)
+
+# /health summary of each readiness state and LiveKit check result
+HEALTH_STATUS = {"ready": "healthy", "degraded": "degraded", "not_ready": "unhealthy"}
+LIVEKIT_STATUS = {True: "connected", False: "unavailable", None: "not_configured"}
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Detailed health check"""
+    livekit_manager = getattr(request.app.state, "livekit_manager", None)
+    room_pool = getattr(request.app.state, "room_pool", None)
+    room_provisioner = getattr(request.app.state, "room_provisioner", None)
+    probe = getattr(request.app.state, "readiness", None)
+    state, report = await probe.check() if probe else ("not_ready", {"checks": {}, "database_pool": {}})
+    checks = report["checks"]
     return {
-        "status": "healthy",
-        "database": "connected",
-        "livekit": "configured",
+        "status": HEALTH_STATUS[state],
+        "database": "connected" if checks.get("database", {}).get("ok") else "unavailable",
+        "livekit": LIVEKIT_STATUS[checks.get("livekit", {}).get("ok")],
+        "checks": checks,
+        "database_pool": {
+            "status": async_engine.pool.status(),
+            **report["database_pool"],
+            **pool_metrics.snapshot(),
+        },
+        "livekit_calls": livekit_manager.stats.snapshot() if livekit_manager else {},
+        "livekit_token_cache": livekit_manager.token_cache.stats() if livekit_manager else {},
+        "room_pool": room_pool.stats() if room_pool else {},
+        "room_provisioning": room_provisioner.stats() if room_provisioner else {},
+        "logging": logging_stats(),
         "version": "1.0.0"
     }
 
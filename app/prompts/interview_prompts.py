@@ -2,9 +2,22 @@
 # File: app/prompts/interview_prompts.py - Prompt Management System
 # =============================================================================
 
-from typing import Dict, List, Optional
+import argparse
+import hashlib
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
 from enum import Enum
 
+# Compiled system prompts kept per (position, company)
+PROMPT_CACHE_SIZE = 256
+# Stands in for the candidate name while compiling; cannot occur in names
+_CANDIDATE_SLOT = "\x00candidate_name\x00"
+# Rough stand-in for a SentencePiece tokenizer: words, digits, punctuation,
+# newlines and runs of spaces each count as one token
+_TOKEN_ESTIMATE = re.compile(r"[A-Za-z]+|\d|\n| {2,}|[^\sA-Za-z\d]")
+
 class InterviewPhase(Enum):
     INTRODUCTION = "introduction"
     TECHNICAL = "technical"
@@ -12,6 +25,31 @@ class InterviewPhase(Enum):
     CLOSING = "closing"
     COMPLETED = "completed"
 
+class CompiledPrompt(NamedTuple):
+    """System prompt for one (position, company), split around the candidate name"""
+    # Content hash of the template; changes whenever its text does
+    version: str
+    head: str
+    tail: str
+
+    def render(self, candidate_name: str) -> str:
+        return self.head + candidate_name + self.tail
+
+
+def normalize_whitespace(text: str) -> str:
+    """Strip indentation and trailing spaces, collapse runs of blank lines"""
+    lines: List[str] = []
+    for line in text.strip().splitlines():
+        line = line.strip()
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(_TOKEN_ESTIMATE.findall(text))
+
+
 class PromptManager:
     """Centralized prompt management system"""
     
@@ -20,6 +58,7 @@ class PromptManager:
         self.position_prompts = self._load_position_prompts()
         self.behavioral_questions = self._load_behavioral_questions()
         self.follow_up_prompts = self._load_follow_up_prompts()
+        self._compiled = lru_cache(maxsize=PROMPT_CACHE_SIZE)(self._compile_system_prompt)
     
     def _load_base_instructions(self) -> str:
         return """You are an AI interviewer conducting a professional job interview. Follow these guidelines:
@@ -142,13 +181,13 @@ class PromptManager:
             "What did you learn from that experience?"
         ]
 
-    def get_system_prompt(
+    def _build_system_prompt(
         self, 
         position: str, 
         candidate_name: str,
         company_name: Optional[str] = None
     ) -> str:
-        """Generate complete system prompt for the interview"""
+        """Full system prompt text, before whitespace normalization"""
         
         company_info = f" at {company_name}" if company_name else ""
         
@@ -183,6 +222,26 @@ class PromptManager:
 
                 Start with a warm welcome and introduction!"""
 
+    def _compile_system_prompt(self, position: str, company_name: Optional[str]) -> CompiledPrompt:
+        template = normalize_whitespace(self._build_system_prompt(position, _CANDIDATE_SLOT, company_name))
+        head, _, tail = template.partition(_CANDIDATE_SLOT)
+        version = hashlib.sha256(template.encode()).hexdigest()[:12]
+        return CompiledPrompt(version, head, tail)
+
+    def compile_system_prompt(self, position: str, company_name: Optional[str] = None) -> CompiledPrompt:
+        """Whitespace-normalized system prompt template, compiled once per
+        (position, company) and cached"""
+        return self._compiled(position, company_name)
+
+    def get_system_prompt(
+        self, 
+        position: str, 
+        candidate_name: str,
+        company_name: Optional[str] = None
+    ) -> str:
+        """Generate complete system prompt for the interview"""
+        return self.compile_system_prompt(position, company_name).render(candidate_name)
+
     def get_technical_questions(self, position: str) -> List[str]:
         """Get technical questions for specific position"""
         position_key = position.lower().replace(" ", "_")
@@ -202,3 +261,46 @@ class PromptManager:
 
 # Global prompt manager instance
 prompt_manager = PromptManager()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Size of the system prompt per position")
+    parser.add_argument("--company", default="Your Company")
+    parser.add_argument("--candidate", default="Candidate")
+    parser.add_argument(
+        "--gemini-model",
+        help="count tokens with this Gemini model's tokenizer (uses GOOGLE_API_KEY) instead of estimating",
+    )
+    args = parser.parse_args(argv)
+
+    count = estimate_tokens
+    if args.gemini_model:
+        from google import genai
+
+        from app.core.config import settings
+
+        client = genai.Client(api_key=settings.GOOGLE_API_KEY)
+
+        def count(text: str) -> int:
+            return client.models.count_tokens(model=args.gemini_model, contents=text).total_tokens
+
+    positions = [key.replace("_", " ").title() for key in prompt_manager.position_prompts]
+    # A position without specific focus gets the generic prompt
+    positions.append("Solutions Architect")
+
+    print(f"{'position':<20} {'version':<12} {'raw chars':>9} {'chars':>6} {'raw tokens':>10} {'tokens':>6} {'saved':>6}")
+    for position in positions:
+        raw = prompt_manager._build_system_prompt(position, args.candidate, args.company)
+        compiled = prompt_manager.compile_system_prompt(position, args.company)
+        compact = compiled.render(args.candidate)
+        raw_tokens, tokens = count(raw), count(compact)
+        print(
+            f"{position:<20} {compiled.version:<12} {len(raw):>9} {len(compact):>6} "
+            f"{raw_tokens:>10} {tokens:>6} {1 - tokens / raw_tokens:>6.0%}"
+        )
+    print("tokens: " + (f"{args.gemini_model} tokenizer" if args.gemini_model else "estimated"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
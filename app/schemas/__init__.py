@@ -8,3 +8,4 @@ from .interview import (
     Interview,
     InterviewToken,
 )
+from .profile import ProfileInfo
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -23,7 +23,7 @@ class InterviewUpdate(BaseModel):
     overall_feedback: Optional[str] = None
 
 
-class Interview(InterviewBase):
+class InterviewSummary(InterviewBase):
     id: str
     status: str
     room_name: str
@@ -36,6 +36,37 @@ class Interview(InterviewBase):
         from_attributes = True
 
 
+class Interview(InterviewSummary):
+    overall_feedback: Optional[str] = None
+    interview_config: Optional[Dict[str, Any]] = None
+    interview_data: Optional[Dict[str, Any]] = None
+    scheduled_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class InterviewBulkCreate(BaseModel):
+    interviews: List[InterviewCreate]
+
+
+class InterviewBulkItem(BaseModel):
+    index: int
+    status: str
+    interview: InterviewSummary
+
+
+class InterviewBulkResult(BaseModel):
+    created: int
+    room_creation_failed: int
+    items: List[InterviewBulkItem]
+
+
+class InterviewStatus(BaseModel):
+    id: str
+    status: str
+
+
 class InterviewToken(BaseModel):
     token: str
     room_name: str
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class ProfileInfo(BaseModel):
+    id: str
+    method: str
+    route: str
+    created_at_ms: int
+    file: str
@@ -0,0 +1,73 @@
+"""Import-time budget for API workers.
+
+    python -m app.startup_profile [--budget-ms 1500] [--runs 3] [--top 15]
+
+Imports ``app.main`` under ``python -X importtime`` in fresh interpreters,
+prints the slowest imports of the fastest run and exits non-zero when that
+run is over budget, or when a module that should only load on first use
+(see DEFERRED_MODULES) was imported. Run it in CI to catch cold-start
+regressions before the autoscaler does.
+"""
+import argparse
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Imported lazily by the API; pulling one in at import time is a regression
+DEFERRED_MODULES = ("livekit", "aiohttp", "coloredlogs", "scalar_fastapi", "pyinstrument")
+
+DEFAULT_BUDGET_MS = 1500
+
+
+def profile_import(module: str) -> List[Tuple[int, int, str]]:
+    """(self_us, cumulative_us, name) for every import made by ``import module``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def _total_ms(rows: List[Tuple[int, int, str]], module: str) -> float:
+    return next(cumulative for _, cumulative, name in rows if name.strip() == module) / 1000
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="take the fastest of N runs")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    runs = [profile_import(args.module) for _ in range(max(1, args.runs))]
+    rows = min(runs, key=lambda run: _total_ms(run, args.module))
+    total = _total_ms(rows, args.module)
+
+    print(f"import {args.module}: {total:.0f} ms (budget {args.budget_ms:.0f} ms, best of {len(runs)})")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[1:args.top + 1]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms self  {name}")
+
+    imported = {name.strip().split(".")[0] for _, _, name in rows}
+    eager = [module for module in DEFERRED_MODULES if module in imported]
+    failed = False
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if total > args.budget_ms:
+        print(f"FAIL: over budget by {total - args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
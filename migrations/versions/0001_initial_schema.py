@@ -0,0 +1,112 @@
+"""initial schema
+
+Tables as created by ``Base.metadata.create_all`` before migrations were
+introduced. ``if_not_exists`` lets databases created that way be upgraded in
+place with ``alembic upgrade head``.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 18:47:22.767113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('users',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('username', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('full_name', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_superuser', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True,
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True, if_not_exists=True)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True, if_not_exists=True)
+
+    op.create_table('token_blocklist',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('jti', sa.String(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True,
+    )
+    op.create_index('ix_token_blocklist_id', 'token_blocklist', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_token_blocklist_jti', 'token_blocklist', ['jti'], unique=True, if_not_exists=True)
+
+    op.create_table('api_keys',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('secret', sa.String(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('usage_count', sa.Integer(), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('owner_id', sa.String(length=36), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True,
+    )
+    op.create_index('ix_api_keys_id', 'api_keys', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_api_keys_key', 'api_keys', ['key'], unique=True, if_not_exists=True)
+
+    op.create_table('interviews',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('candidate_name', sa.String(), nullable=False),
+    sa.Column('candidate_email', sa.String(), nullable=True),
+    sa.Column('position', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('room_name', sa.String(), nullable=False),
+    sa.Column('interview_token', sa.String(), nullable=True),
+    sa.Column('interview_config', sa.JSON(), nullable=True),
+    sa.Column('technical_score', sa.Integer(), nullable=True),
+    sa.Column('behavioral_score', sa.Integer(), nullable=True),
+    sa.Column('overall_feedback', sa.Text(), nullable=True),
+    sa.Column('interview_data', sa.JSON(), nullable=True),
+    sa.Column('scheduled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('creator_id', sa.String(length=36), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['creator_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('room_name'),
+    if_not_exists=True,
+    )
+    op.create_index('ix_interviews_id', 'interviews', ['id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_interviews_id', table_name='interviews')
+    op.drop_table('interviews')
+    op.drop_index('ix_api_keys_key', table_name='api_keys')
+    op.drop_index('ix_api_keys_id', table_name='api_keys')
+    op.drop_table('api_keys')
+    op.drop_index('ix_token_blocklist_jti', table_name='token_blocklist')
+    op.drop_index('ix_token_blocklist_id', table_name='token_blocklist')
+    op.drop_table('token_blocklist')
+    op.drop_index('ix_users_username', table_name='users')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,32 @@
+"""interviews (creator_id, created_at, id) index for keyset pagination
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 18:52:10.412931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_interviews_creator_created_id',
+        'interviews',
+        ['creator_id', 'created_at', 'id'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_interviews_creator_created_id', table_name='interviews')
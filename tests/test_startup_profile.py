@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+from app import startup_profile
+
+# Settings the API cannot start without; the imports run in child interpreters
+# that inherit this environment
+REQUIRED_ENV = ("GOOGLE_API_KEY", "DEEPGRAM_API_KEY", "CARTESIA_API_KEY", "ELEVENLABS_API_KEY")
+
+
+def test_app_import_within_budget(monkeypatch, capsys):
+    for name in REQUIRED_ENV:
+        monkeypatch.setenv(name, os.environ.get(name, ""))
+    monkeypatch.chdir(Path(__file__).resolve().parent.parent)
+
+    exit_code = startup_profile.main(["--budget-ms", str(startup_profile.DEFAULT_BUDGET_MS)])
+
+    assert exit_code == 0, capsys.readouterr().out